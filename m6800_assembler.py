@@ -5,17 +5,88 @@ Handles instruction parsing, validation, and machine code generation.
 """
 
 import re
-from typing import Dict, List, Tuple, Optional, Any
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple, Optional, Any
+
+
+# Opcode groups tested on every encoded line; frozensets keep membership O(1)
+_BRANCH_OPCODES = frozenset({'BCC', 'BCS', 'BEQ', 'BGE', 'BGT', 'BHI', 'BLE', 'BLS',
+                             'BLT', 'BMI', 'BNE', 'BPL', 'BRA', 'BSR', 'BVC', 'BVS'})
+_IMM16_OPCODES = frozenset({'LDX', 'LDS', 'CPX', 'LDD', 'LDY', 'CPD', 'CPY', 'ADDD'})
+_SHIFT_LIKE = frozenset({'INC', 'DEC', 'CLR', 'TST', 'NEG', 'COM',
+                         'ASL', 'ASR', 'LSR', 'ROL', 'ROR'})
+_DEFAULT_A = frozenset({'CMP', 'ADC', 'ADD', 'AND', 'BIT', 'EOR', 'ORA', 'SBC', 'SUB'})
+# Base opcodes whose 4-letter forms (e.g. LDAA, PSHB) carry the register in the name
+_REGISTER_IMPLIED = _DEFAULT_A | _SHIFT_LIKE | {'PSH', 'PUL'}
+
+# Well-formed numeric literals (operands are uppercased first); the named group
+# that matched selects the base
+_NUM_RE = re.compile(r'\$(?P<hex1>[0-9A-F]+)|0X(?P<hex2>[0-9A-F]+)|%(?P<bin1>[01]+)|0B(?P<bin2>[01]+)|(?P<dec>[0-9]+)')
+_NUM_BASES = {'hex1': 16, 'hex2': 16, 'bin1': 2, 'bin2': 2, 'dec': 10}
+
+# Most frequent opcode/mode pairs in typical M6800 programs; their encoders are
+# built up front instead of on first use
+_HOT_ENCODER_KEYS = (('LDA', 'IMM'), ('STA', 'EXT'), ('LDB', 'IMM'), ('STB', 'EXT'),
+                     ('JMP', 'EXT'), ('JSR', 'EXT'), ('BEQ', 'REL'), ('BNE', 'REL'),
+                     ('BRA', 'REL'))
+
+# 4-letter M6800 mnemonics and the 3-letter base instruction they assemble as
+_FOUR_LETTER_MAP = {
+    # 4-letter syntax -> 3-letter syntax
+    'LDAA': 'LDA',  'LDAB': 'LDB',  'LDAX': 'LDX',  'LDAS': 'LDS',
+    'STAA': 'STA',  'STAB': 'STB',  'STAX': 'STX',  'STAS': 'STS',
+    'ADDA': 'ADD',  'ADDB': 'ADD',  'ADCA': 'ADC',  'ADCB': 'ADC',
+    'SUBA': 'SUB',  'SUBB': 'SUB',  'SBCA': 'SBC',  'SBCB': 'SBC',
+    'ANDA': 'AND',  'ANDB': 'AND',  'EORA': 'EOR',  'EORB': 'EOR',
+    'ORAA': 'ORA',  'ORAB': 'ORB',  'BITA': 'BIT',  'BITB': 'BIT',
+    'CMPA': 'CMP',  'CMPB': 'CMP',  'CPXA': 'CPX',  'CPXB': 'CPX',
+    'TSTA': 'TST',  'TSTB': 'TST',  'CLRA': 'CLR',  'CLRB': 'CLR',
+    'COMA': 'COM',  'COMB': 'COM',  'NEGA': 'NEG',  'NEGB': 'NEG',
+    'INCA': 'INC',  'INCB': 'INC',  'DECA': 'DEC',  'DECB': 'DEC',
+    'ASLA': 'ASL',  'ASLB': 'ASL',  'ASRA': 'ASR',  'ASRB': 'ASR',
+    'LSRA': 'LSR',  'LSRB': 'LSR',  'ROLA': 'ROL',  'ROLB': 'ROL',
+    'RORA': 'ROR',  'RORB': 'ROR',  'PSHA': 'PSH',  'PSHB': 'PSH',
+    'PULA': 'PUL',  'PULB': 'PUL',
+}
+
+
+def _opcode_bytes(value: int) -> bytes:
+    """Big-endian bytes of an opcode; prefixed M6811 opcodes are stored as one integer (e.g. 0x18CE)."""
+    return value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big')
+
+
+@lru_cache(maxsize=None)
+def _addr_hex_table() -> Tuple[str, ...]:
+    """Four-digit hex text of every 16-bit address, built on first use."""
+    return tuple(f"{addr:04X}" for addr in range(0x10000))
+
 
 class M6800Assembler:
     """Core assembler class for Motorola 6800 processor."""
     
+    # Operand shapes recognised before numeric parsing: #value, offset,X, A/B;
+    # any ',X' in the operand marks it as indexed
+    _OPERAND_RE = re.compile(r'^(?:#(.*)|(.*,X.*)|([AB]))$')
+    
+    # Label names: letter or underscore, then letters, digits or underscores
+    _LABEL_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+    
     def __init__(self):
         """Initialize the assembler."""
         self.instruction_set = self._build_instruction_set()
+        self._opcode_meta = self._build_opcode_meta()
+        self._inh_scalar, self._inh_reg = self._build_inherent_tables()
         self.four_letter_mapping = self._get_4letter_mapping()
+        self._size_cache: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        self._encoders: Dict[Tuple[str, str, Optional[str]], Callable[[Dict[str, Any]], bytes]] = {}
+        self._code_buf = bytearray(8)  # scratch buffer shared by all encoders
+        for opcode, mode in _HOT_ENCODER_KEYS:
+            self._encoders[(opcode, mode, None)] = self._build_encoder(opcode, mode, None)
         self.labels = {}
         self.assembled_lines = []
+        self.mapping_rows = ()
+        self._reset_line_columns()
         self.errors = []
         self.messages = []
         self.origin_address = 0x1000
@@ -167,6 +238,48 @@ class M6800Assembler:
             'BRCLR': {'DIR': 0x13, 'IDX': 0x1F},   # Branch if bits clear
         }
     
+    def _build_opcode_meta(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Pre-encode every opcode of the instruction set into its byte form.
+        
+        Returns:
+            Dictionary mapping opcode -> mode -> (opcode_bytes, length), or
+            opcode -> mode -> {'A': (opcode_bytes, length), 'B': ...} for
+            register-specific entries
+        """
+        def encode(value: int) -> Tuple[bytes, int]:
+            opcode_bytes = _opcode_bytes(value)
+            return opcode_bytes, len(opcode_bytes)
+        
+        opcode_meta = {}
+        for opcode, modes in self.instruction_set.items():
+            opcode_meta[opcode] = {
+                mode: ({reg: encode(val) for reg, val in value.items()}
+                       if isinstance(value, dict) else encode(value))
+                for mode, value in modes.items()
+                if value is not None  # placeholder for an unsupported mode
+            }
+        return opcode_meta
+    
+    def _build_inherent_tables(self) -> Tuple[Dict[str, Tuple[bytes, int]], Dict[str, Dict[str, Tuple[bytes, int]]]]:
+        """
+        Split inherent-mode opcodes by shape so encoding doesn't need type checks.
+        
+        Returns:
+            Tuple of (scalar_opcodes, register_opcodes) where scalar entries map a
+            mnemonic to its (opcode_bytes, length) and register entries map it to
+            {'A': (opcode_bytes, length), 'B': ...}
+        """
+        inh_scalar = {}
+        inh_reg = {}
+        for opcode, modes in self._opcode_meta.items():
+            opcode_info = modes.get('INH')
+            if isinstance(opcode_info, dict):
+                inh_reg[opcode] = opcode_info
+            elif opcode_info is not None:
+                inh_scalar[opcode] = opcode_info
+        return inh_scalar, inh_reg
+    
     def assemble(self, source_code: str) -> Dict[str, Any]:
         """
         Assemble the given source code and return results.
@@ -180,7 +293,7 @@ class M6800Assembler:
         # Reset assembler state
         self.labels = {}
         self.current_address = self.origin_address
-        self.assembled_lines = []
+        self._reset_line_columns()
         self.errors = []
         self.messages = []
         
@@ -197,44 +310,95 @@ class M6800Assembler:
         success = len(self.errors) == 0
         object_code = self._format_object_code() if success else ""
         object_data = self._get_object_data() if success else {}
+        self.assembled_lines = self._build_mappings()
         
         return {
             'success': success,
             'object_code': object_code,
             'object_data': object_data,
             'mappings': self.assembled_lines,
+            'mapping_rows': self.mapping_rows,
             'errors': self.errors,
             'messages': self.messages,
             'labels': self.labels
         }
     
+    def _reset_line_columns(self) -> None:
+        """Clear the per-line output columns filled by the second pass."""
+        # Parallel columns, one entry per emitted line: source line number,
+        # load address, encoded bytes and original source text
+        self._line_numbers: List[int] = []
+        self._addresses: List[int] = []
+        self._obj_bytes: List[bytes] = []
+        self._sources: List[str] = []
+    
+    def _record_line(self, line_num: int, object_bytes: bytes, source: str) -> None:
+        """Record an emitted line at the current address."""
+        self._line_numbers.append(line_num)
+        self._addresses.append(self.current_address)
+        self._obj_bytes.append(object_bytes)
+        self._sources.append(source)
+    
+    def _build_mappings(self) -> List[Dict[str, Any]]:
+        """Build the per-line source/object mapping records from the line columns.
+        
+        Also sets mapping_rows, the same records as (line, address, object
+        code, assembly) tuples ready to be shown as table rows.
+        """
+        addr_hex = _addr_hex_table()
+        addresses = ['$' + (addr_hex[address] if address <= 0xFFFF else f"{address:04X}")
+                     for address in self._addresses]
+        object_codes = [object_bytes.hex(' ').upper() for object_bytes in self._obj_bytes]
+        self.mapping_rows = tuple(zip(self._line_numbers, addresses, object_codes, self._sources))
+        return [
+            {
+                'line': line_num,
+                'address': address,
+                'object_code': object_code,
+                'object_bytes': object_bytes,
+                'assembly': source
+            }
+            for (line_num, address, object_code, source), object_bytes in zip(
+                self.mapping_rows, self._obj_bytes)
+        ]
+    
     def _first_pass(self, lines: List[str]) -> None:
         """First pass: collect labels and handle pseudo-instructions."""
         self.current_address = self.origin_address
         
+        # Bind loop-invariant lookups once instead of resolving them per line
+        clean = self._clean_line
+        parse_label = self._parse_line_for_label
+        labels = self.labels
+        instruction_set = self.instruction_set
+        four_letter_mapping = self.four_letter_mapping
+        
         for line_num, line in enumerate(lines, 1):
-            clean_line = self._clean_line(line)
+            clean_line = clean(line)
             if not clean_line:
                 continue
                 
             # Use unified label parsing
-            label, clean_line = self._parse_line_for_label(clean_line, line_num)
+            label, clean_line = parse_label(clean_line, line_num)
             
-            # If we found a label, add it to the symbol table
+            # If we found a label, add it to the symbol table. Keys are stored
+            # uppercased so operand lookups (already uppercased) need no conversion.
             if label:
+                label_key = label.upper()
                 # Check for duplicate label definition
-                if label in self.labels:
-                    self.errors.append(f"Line {line_num}: Duplicate label '{label}' - already defined at address ${self.labels[label]:04X}")
+                if label_key in labels:
+                    self.errors.append(f"Line {line_num}: Duplicate label '{label}' - already defined at address ${labels[label_key]:04X}")
                 else:
-                    self.labels[label] = self.current_address
+                    labels[label_key] = self.current_address
             
             if not clean_line:
                 continue
             
-            # Handle pseudo-instructions
-            tokens = clean_line.split()
+            # Handle pseudo-instructions. Tokens are uppercased once here so the
+            # encoding helpers can assume canonical mnemonics and operands.
+            tokens = clean_line.upper().split()
             if tokens:
-                opcode = tokens[0].upper()
+                opcode = sys.intern(tokens[0])
                 
                 # Handle both ORG and .ORG
                 if opcode == 'ORG' or opcode == '.ORG':
@@ -256,7 +420,7 @@ class M6800Assembler:
                             self.current_address += 1  # .BYTE takes 1 byte
                         except ValueError:
                             self.errors.append(f"Line {line_num}: Invalid .BYTE value: {tokens[1]}")
-                elif opcode in self.instruction_set:
+                elif opcode in instruction_set:
                     # Calculate instruction size for address calculation
                     try:
                         # Use unified operand parsing for all instructions
@@ -268,10 +432,10 @@ class M6800Assembler:
                     except Exception as e:
                         self.errors.append(f"Line {line_num}: Error in {opcode}: {str(e)}")
                 # Check for 4-letter instruction syntax
-                elif opcode in self.four_letter_mapping:
+                elif opcode in four_letter_mapping:
                     # Map 4-letter to 3-letter and calculate size
                     try:
-                        mapped_opcode = self.four_letter_mapping[opcode]
+                        mapped_opcode = four_letter_mapping[opcode]
                         size = self._calculate_instruction_size(mapped_opcode, tokens[1:] if len(tokens) > 1 else [])
                         self.current_address += size
                     except ValueError as e:
@@ -283,9 +447,17 @@ class M6800Assembler:
         """Second pass: generate machine code."""
         self.current_address = self.origin_address
         
+        # Bind loop-invariant lookups once instead of resolving them per line
+        clean = self._clean_line
+        parse_label = self._parse_line_for_label
+        assemble_instruction = self._assemble_instruction
+        instruction_set = self.instruction_set
+        four_letter_mapping = self.four_letter_mapping
+        record_line = self._record_line
+        
         for line_num, line in enumerate(lines, 1):
             original_line = line.strip()
-            clean_line = self._clean_line(line)
+            clean_line = clean(line)
             
             # --- START DEBUG PRINTS (Temporarily add for debugging) ---
             # print(f"DEBUG_SECOND_PASS: Processing line {line_num}: '{original_line}' (clean: '{clean_line}')")
@@ -295,16 +467,16 @@ class M6800Assembler:
                 continue
             
             # Use unified label parsing (ignore label name in second pass, just get remaining line)
-            _, clean_line = self._parse_line_for_label(clean_line, line_num)
+            _, clean_line = parse_label(clean_line, line_num)
             
             if not clean_line:
                 continue
             
-            tokens = clean_line.split()
+            tokens = clean_line.upper().split()
             if not tokens:
                 continue
                 
-            opcode = tokens[0].upper()
+            opcode = sys.intern(tokens[0])
             
             # Handle pseudo-instructions
             # Handle both ORG and .ORG
@@ -320,39 +492,27 @@ class M6800Assembler:
                 if len(tokens) >= 2:
                     try:
                         value = self._parse_number(tokens[1])
-                        self.assembled_lines.append({
-                            'line': line_num,
-                            'address': f"${self.current_address:04X}",
-                            'object_code': f"{value:02X}",
-                            'assembly': original_line
-                        })
+                        record_line(line_num, bytes((value,)), original_line)  # ValueError if > $FF
                         self.current_address += 1
                     except ValueError:
                         self.errors.append(f"Line {line_num}: Invalid .BYTE value: {tokens[1]}")
                 continue
             
             # Check for 4-letter instruction syntax first
-            if opcode in self.four_letter_mapping:
-                mapped_opcode = self.four_letter_mapping[opcode]
+            mapped_opcode = four_letter_mapping.get(opcode)
+            if mapped_opcode is not None:
                 # Determine register from 4-letter instruction
                 register = opcode[-1] if opcode[-1] in ['A', 'B'] else None
                 
                 try:
                     operands = tokens[1:] if len(tokens) > 1 else []
                     # Add register to operands if instruction implies it
-                    if register and mapped_opcode in ['ADD', 'ADC', 'SUB', 'SBC', 'AND', 'EOR', 'ORA', 'BIT', 'CMP', 
-                                                      'TST', 'CLR', 'COM', 'NEG', 'INC', 'DEC', 'ASL', 'ASR', 'LSR', 
-                                                      'ROL', 'ROR', 'PSH', 'PUL']:
+                    if register and mapped_opcode in _REGISTER_IMPLIED:
                         operands = [register] + operands
                     
-                    machine_code = self._assemble_instruction(mapped_opcode, operands)
+                    machine_code = assemble_instruction(mapped_opcode, operands)
                     
-                    self.assembled_lines.append({
-                        'line': line_num,
-                        'address': f"${self.current_address:04X}",
-                        'object_code': ' '.join(f"{byte:02X}" for byte in machine_code),
-                        'assembly': original_line
-                    })
+                    record_line(line_num, machine_code, original_line)
                     
                     self.current_address += len(machine_code)
                     
@@ -366,22 +526,17 @@ class M6800Assembler:
                     self.errors.append(f"Line {line_num}: Assembly error in {opcode}: {str(e)}")
             
             # Handle regular instructions
-            elif opcode in self.instruction_set:
+            elif opcode in instruction_set:
                 try:
                     # Use unified operand parsing for all instructions
                     operands = self._parse_instruction_operands(opcode, tokens[1:] if len(tokens) > 1 else [])
-                    machine_code = self._assemble_instruction(opcode, operands)
+                    machine_code = assemble_instruction(opcode, operands)
                     
                     # --- START DEBUG PRINTS (Temporarily add for debugging) ---
                     # print(f"DEBUG_SECOND_PASS: Line {line_num} ('{original_line.strip()}'): Assembled as {machine_code} (current_address=${self.current_address:04X})")
                     # --- END DEBUG PRINTS ---
 
-                    self.assembled_lines.append({
-                        'line': line_num,
-                        'address': f"${self.current_address:04X}",
-                        'object_code': ' '.join(f"{byte:02X}" for byte in machine_code),
-                        'assembly': original_line
-                    })
+                    record_line(line_num, machine_code, original_line)
                     
                     self.current_address += len(machine_code)
                     
@@ -397,7 +552,7 @@ class M6800Assembler:
             else:
                 self.errors.append(f"Line {line_num}: Unknown instruction: {opcode}")
     
-    def _assemble_instruction(self, opcode: str, operands: List[str]) -> List[int]:
+    def _assemble_instruction(self, opcode: str, operands: List[str]) -> bytes:
         """Assemble a single instruction into machine code."""
         instruction_def = self.instruction_set[opcode]
         
@@ -408,7 +563,7 @@ class M6800Assembler:
             # Get opcode byte for the addressing mode
             addressing_mode = parsed_info['addressing_mode']
             opcode_byte = instruction_def[addressing_mode]
-            machine_code = [opcode_byte, parsed_info['address_or_offset'], parsed_info['mask_value']]
+            machine_code = bytearray([opcode_byte, parsed_info['address_or_offset'], parsed_info['mask_value']])
                 
             # For branch instructions, add the branch target offset
             if opcode in ['BRSET', 'BRCLR']:
@@ -421,27 +576,29 @@ class M6800Assembler:
                     raise ValueError(f"Branch target too far: {offset} bytes (range is -128 to +127)")
                 machine_code.append(offset & 0xFF)
                 
-            return machine_code
+            return bytes(machine_code)
         
         # --- START REVISED INHERENT INSTRUCTION HANDLING ---
         if not operands:
             # This handles instructions like ABA, TAB, TBA, NOP, SWI, INCA, TST, etc.
-            if 'INH' not in instruction_def:
-                # If no operands are provided, but the instruction doesn't have an 'INH' mode, it's an error.
-                raise ValueError(f"Instruction {opcode} requires an explicit operand or addressing mode.")
-                
-            opcode_info = instruction_def['INH'] # This will be either an int or a dict.
+            # Inherent opcodes were classified once at init, so two dict probes replace
+            # the per-call type check on instruction_def['INH'].
+            opcode_entry = self._inh_scalar.get(opcode)
             
-            if isinstance(opcode_info, dict):
+            if opcode_entry is None:
+                reg_opcodes = self._inh_reg.get(opcode)
+                if reg_opcodes is None:
+                    # If no operands are provided, but the instruction doesn't have an 'INH' mode, it's an error.
+                    raise ValueError(f"Instruction {opcode} requires an explicit operand or addressing mode.")
+                
                 # This path is for instructions where 'INH' is a dict,
                 # meaning they can implicitly operate on A or B, or need selection.
                 # Example: ASL, INC, TST (when written without A/B like 'ASL', 'INC')
                 
                 # Check if it's one of the known implicit accumulator operations
-                if opcode in ['ASL', 'ASR', 'LSR', 'ROL', 'ROR', 
-                              'INC', 'DEC', 'CLR', 'TST', 'NEG', 'COM']:
+                if opcode in _SHIFT_LIKE:
                     # These instructions implicitly operate on A if no explicit register is specified.
-                    opcode_byte = opcode_info['A'] # Default to A accumulator
+                    opcode_entry = reg_opcodes['A'] # Default to A accumulator
                 elif opcode in ['PSH', 'PUL']:
                     # PSH/PUL without A/B explicitly given is usually an error in most assemblers
                     # as it's ambiguous. In M6800, PSHA/PSHB are distinct opcodes.
@@ -452,25 +609,9 @@ class M6800Assembler:
                     # if the instruction_set is complete and correctly structured.
                     # It would indicate an 'INH' entry is a dict but the opcode isn't handled by the above list.
                     raise ValueError(f"Ambiguous inherent instruction {opcode} (no explicit register and not recognized implicit A/B op).")
-            else:
-                # This path handles truly inherent instructions where the 'INH' definition
-                # is a direct integer opcode (e.g., ABA, TAB, TBA, NOP, SWI, DAA, RTI, RTS, etc.).
-                opcode_byte = opcode_info # Direct opcode value (e.g., 0x1B for ABA)
-            
-            # Now, opcode_byte holds the final opcode integer. Build machine code.
-            machine_code = []
-            if isinstance(opcode_byte, int): # Ensure it's an int, not some other type if logic was flawed.
-                if opcode_byte > 0xFFFF:  # 3-byte opcode (e.g. some M6811 prefixed inherent ops)
-                    machine_code.extend([(opcode_byte >> 16) & 0xFF, (opcode_byte >> 8) & 0xFF, opcode_byte & 0xFF])
-                elif opcode_byte > 0xFF:  # 2-byte opcode (e.g. M6811 INY, DEY)
-                    machine_code.extend([(opcode_byte >> 8) & 0xFF, opcode_byte & 0xFF])
-                else:  # 1-byte opcode
-                    machine_code.append(opcode_byte)
-            else:
-                # Should not be reached if opcode_info is always int or dict and handled.
-                raise ValueError(f"Internal assembler error: Inherent opcode for {opcode} has unexpected type {type(opcode_byte)}.")
             
-            return machine_code
+            # Now, opcode_entry holds the pre-encoded opcode (1-3 bytes). Build machine code.
+            return opcode_entry[0]
         # --- END REVISED INHERENT INSTRUCTION HANDLING ---
         
         # Handle instructions with explicit operands (e.g., LDA #$55, CMP A #$55)
@@ -478,8 +619,8 @@ class M6800Assembler:
         operand_start = 0
         
         # Check if first operand is a register specifier
-        if len(operands) > 0 and operands[0].upper() in ['A', 'B']:
-            register = operands[0].upper()
+        if len(operands) > 0 and operands[0] in ('A', 'B'):
+            register = operands[0]
             operand_start = 1
         
         # Get the actual operand (skip register if present)
@@ -491,7 +632,7 @@ class M6800Assembler:
         
         # Special handling for instructions that might need default register (e.g., CMP #$55 -> CMPA #$55)
         # This occurs when an operand is present, but no explicit register 'A' or 'B' was given.
-        if not register and operand and opcode in ['CMP', 'ADC', 'ADD', 'AND', 'BIT', 'EOR', 'ORA', 'SBC', 'SUB']:
+        if not register and operand and opcode in _DEFAULT_A:
             # Default to accumulator A for comparison and arithmetic operations if no register explicitly specified
             register = 'A'
         
@@ -501,82 +642,108 @@ class M6800Assembler:
         if register:
             parsed_operand['register'] = register
         
+        # Encode with the specialised encoder for this opcode/mode/register,
+        # building it on first use
+        encoder_key = (opcode, addressing_mode, parsed_operand.get('register'))
+        encoder = self._encoders.get(encoder_key)
+        if encoder is None:
+            encoder = self._build_encoder(*encoder_key)
+            self._encoders[encoder_key] = encoder
+        
+        return encoder(parsed_operand)
+    
+    def _build_encoder(self, opcode: str, addressing_mode: str, register: Optional[str]) -> Callable[[Dict[str, Any]], bytes]:
+        """
+        Build an encoder specialised for one opcode, addressing mode and register.
+        
+        Opcode selection and the operand width are fixed per key, so the returned
+        function only range-checks the operand and appends its bytes.
+        """
         # Get opcode for the addressing mode
-        if addressing_mode not in instruction_def:
+        opcode_info = self._opcode_meta[opcode].get(addressing_mode)
+        if opcode_info is None:
             raise ValueError(f"Addressing mode {addressing_mode} not supported for {opcode}")
         
-        opcode_info = instruction_def[addressing_mode]
-        
         # Handle register-specific opcodes (e.g., ADC A, ADC B)
         if isinstance(opcode_info, dict):
-            if 'register' in parsed_operand:
-                reg = parsed_operand['register']
-                if reg not in opcode_info:
-                    raise ValueError(f"Register {reg} not supported for {opcode} with {addressing_mode} mode")
-                opcode_byte = opcode_info[reg]
-            else:
+            if register is None:
                 # This should only happen if the instruction's addressing mode is a dict (e.g., ADC)
                 # but no register was parsed (e.g., "ADC #$10" without "ADC A #$10").
-                # The 'register' variable from above already handled this, defaulting to 'A' or setting 'register'.
-                # So this else implies a logical error in prior parsing or non-standard instruction.
+                # _assemble_instruction already defaults to 'A' where that is meaningful,
+                # so this implies a logical error in prior parsing or non-standard instruction.
                 raise ValueError(f"Instruction {opcode} requires register specification for {addressing_mode} mode.")
+            if register not in opcode_info:
+                raise ValueError(f"Register {register} not supported for {opcode} with {addressing_mode} mode")
+            opcode_bytes = opcode_info[register][0]
         else:
-            opcode_byte = opcode_info
-        
-        # Build machine code - handle multi-byte opcodes
-        machine_code = []
-        if isinstance(opcode_byte, int):
-            if opcode_byte > 0xFFFF:  # 3-byte opcode
-                machine_code.extend([(opcode_byte >> 16) & 0xFF, (opcode_byte >> 8) & 0xFF, opcode_byte & 0xFF])
-            elif opcode_byte > 0xFF:  # 2-byte opcode
-                machine_code.extend([(opcode_byte >> 8) & 0xFF, opcode_byte & 0xFF])
-            else:  # 1-byte opcode
-                machine_code.append(opcode_byte)
-        else:
-            machine_code.append(opcode_byte) # Should not happen if opcode_byte is always int.
+            opcode_bytes = opcode_info[0]
         
-        # Add operand bytes
+        # Operand bytes per addressing mode; multi-byte opcodes were pre-encoded at init.
+        # Each instruction is laid out in the shared scratch buffer and copied out once.
+        code_buf = self._code_buf
         if addressing_mode == 'IMM':
-            if 'value' in parsed_operand:
-                value = parsed_operand['value']
-                if opcode in ['LDX', 'LDS', 'CPX', 'LDD', 'LDY', 'CPD', 'CPY', 'ADDD']:  # 16-bit immediate
+            if opcode in _IMM16_OPCODES:  # 16-bit immediate
+                def encode(parsed_operand):
+                    value = parsed_operand['value']
                     if value > 0xFFFF:
                         raise ValueError(f"16-bit immediate value ${value:X} too large (max is $FFFF)")
-                    machine_code.extend([value >> 8, value & 0xFF])
-                else:  # 8-bit immediate
+                    code_buf[:] = opcode_bytes
+                    code_buf.extend((value >> 8, value & 0xFF))
+                    return bytes(code_buf)
+            else:  # 8-bit immediate
+                def encode(parsed_operand):
+                    value = parsed_operand['value']
                     if value > 0xFF:
                         raise ValueError(f"8-bit immediate value ${value:X} too large (max is $FF)")
-                    machine_code.append(value & 0xFF)
+                    code_buf[:] = opcode_bytes
+                    code_buf.append(value & 0xFF)
+                    return bytes(code_buf)
         elif addressing_mode == 'DIR':
-            addr = parsed_operand['address']
-            if addr > 0xFF:
-                raise ValueError(f"Direct page address ${addr:X} too large (max is $FF). Use extended addressing for addresses > $FF")
-            machine_code.append(addr & 0xFF)
+            def encode(parsed_operand):
+                addr = parsed_operand['address']
+                if addr > 0xFF:
+                    raise ValueError(f"Direct page address ${addr:X} too large (max is $FF). Use extended addressing for addresses > $FF")
+                code_buf[:] = opcode_bytes
+                code_buf.append(addr & 0xFF)
+                return bytes(code_buf)
         elif addressing_mode == 'EXT':
-            addr = parsed_operand['address']
-            if addr > 0xFFFF:
-                raise ValueError(f"Extended address ${addr:X} too large (max is $FFFF)")
-            machine_code.extend([addr >> 8, addr & 0xFF])
+            def encode(parsed_operand):
+                addr = parsed_operand['address']
+                if addr > 0xFFFF:
+                    raise ValueError(f"Extended address ${addr:X} too large (max is $FFFF)")
+                code_buf[:] = opcode_bytes
+                code_buf.extend((addr >> 8, addr & 0xFF))
+                return bytes(code_buf)
         elif addressing_mode == 'IDX':
-            offset = parsed_operand['offset']
-            if offset > 0xFF:
-                raise ValueError(f"Indexed offset ${offset:X} too large (max is $FF)")
-            machine_code.append(offset & 0xFF)
+            def encode(parsed_operand):
+                offset = parsed_operand['offset']
+                if offset > 0xFF:
+                    raise ValueError(f"Indexed offset ${offset:X} too large (max is $FF)")
+                code_buf[:] = opcode_bytes
+                code_buf.append(offset & 0xFF)
+                return bytes(code_buf)
         elif addressing_mode == 'REL':
-            # Calculate relative offset
-            target = parsed_operand['address']
             # Account for multi-byte instruction length
-            instruction_length = len(machine_code) + 1  # +1 for the offset byte
-            offset = target - (self.current_address + instruction_length)
-            # Only validate range if target is non-zero (i.e., label was resolved)
-            if target != 0 and (offset < -128 or offset > 127):
-                if offset < -128:
-                    raise ValueError(f"Branch target too far backward: {offset} bytes (min is -128)")
-                else:
-                    raise ValueError(f"Branch target too far forward: {offset} bytes (max is +127)")
-            machine_code.append(offset & 0xFF)
+            instruction_length = len(opcode_bytes) + 1  # +1 for the offset byte
+            def encode(parsed_operand):
+                # Calculate relative offset
+                target = parsed_operand['address']
+                offset = target - (self.current_address + instruction_length)
+                # Only validate range if target is non-zero (i.e., label was resolved)
+                if target != 0 and (offset < -128 or offset > 127):
+                    if offset < -128:
+                        raise ValueError(f"Branch target too far backward: {offset} bytes (min is -128)")
+                    else:
+                        raise ValueError(f"Branch target too far forward: {offset} bytes (max is +127)")
+                code_buf[:] = opcode_bytes
+                code_buf.append(offset & 0xFF)
+                return bytes(code_buf)
+        else:
+            # Register-only forms (e.g. 'CMP A') carry no operand bytes
+            def encode(parsed_operand):
+                return opcode_bytes
         
-        return machine_code
+        return encode
     
     def _parse_operand(self, operand: str, opcode: str) -> Tuple[str, Dict[str, Any]]:
         """
@@ -585,40 +752,47 @@ class M6800Assembler:
         Returns:
             Tuple of (addressing_mode, parsed_data)
         """
-        operand = operand.strip()
-        
-        # Immediate addressing: #value
-        if operand.startswith('#'):
-            value_str = operand[1:]
-            return 'IMM', {'value': self._parse_number(value_str)}
-        
-        # Indexed addressing: offset,X
-        if ',X' in operand.upper():
-            offset_str = operand.upper().replace(',X', '').strip()
-            offset = self._parse_number(offset_str) if offset_str else 0
-            return 'IDX', {'offset': offset}
-        
-        # Register specification for inherent instructions (e.g., 'LDA A' (though LDAA is preferred))
-        # Note: This branch in _parse_operand is crucial for parsing `CMP A #$55` type syntax.
-        # For 'simple' inherent ops like 'ABA', 'TAB', 'NOP', they don't have an 'operand' in assembly
-        # so they hit the 'if not operands:' block in _assemble_instruction/size directly.
-        if operand.upper() in ['A', 'B']:
-            return 'INH', {'register': operand.upper()}
+        op_u = operand.strip()  # operands arrive uppercased from tokenization
+        is_branch = opcode in _BRANCH_OPCODES
         
-        # Check if this is a branch instruction - they use relative addressing
-        branch_instructions = ['BCC', 'BCS', 'BEQ', 'BGE', 'BGT', 'BHI', 'BLE', 'BLS', 
-                              'BLT', 'BMI', 'BNE', 'BPL', 'BRA', 'BSR', 'BVC', 'BVS']
+        # Operands naming a defined label (typically branch targets) resolve with one
+        # lookup; label names can't look like #value or offset,X, and A/B stay registers
+        if op_u not in ('A', 'B'):
+            address = self.labels.get(op_u)
+            if address is not None:
+                if is_branch:
+                    return 'REL', {'address': address}
+                return ('DIR' if address <= 0xFF else 'EXT'), {'address': address}
         
-        if opcode.upper() in branch_instructions:
-            # Branch instructions use relative addressing
-            if operand.upper() in self.labels:
-                address = self.labels[operand.upper()]
-            else:
-                address = self._parse_number(operand)
-            return 'REL', {'address': address}
+        # One match classifies the operand shape: group 1 is #value (immediate),
+        # group 2 is offset,X (indexed) and group 3 is a bare A/B register
+        match = self._OPERAND_RE.match(op_u)
+        if match:
+            kind = match.lastindex
+            
+            # Immediate addressing: #value
+            if kind == 1:
+                return 'IMM', {'value': self._parse_number(match.group(1))}
+            
+            # Indexed addressing: offset,X
+            if kind == 2:
+                offset_str = match.group(2).replace(',X', '').strip()
+                offset = self._parse_number(offset_str) if offset_str else 0
+                return 'IDX', {'offset': offset}
+            
+            # Register specification for inherent instructions (e.g., 'LDA A' (though LDAA is preferred))
+            # Note: This branch in _parse_operand is crucial for parsing `CMP A #$55` type syntax.
+            # For 'simple' inherent ops like 'ABA', 'TAB', 'NOP', they don't have an 'operand' in assembly
+            # so they hit the 'if not operands:' block in _assemble_instruction/size directly.
+            return 'INH', {'register': op_u}
+        
+        # Check if this is a branch instruction - they use relative addressing
+        if is_branch:
+            # Branch instructions use relative addressing (label targets were resolved above)
+            return 'REL', {'address': self._parse_number(op_u)}
         
         # Direct or Extended addressing (determined by address value)
-        address = self._parse_number(operand)
+        address = self._parse_number(op_u)
         
         # Direct page (0x00-0xFF) vs Extended (0x0100-0xFFFF)
         if address <= 0xFF:
@@ -633,56 +807,41 @@ class M6800Assembler:
         if not num_str:
             raise ValueError("Empty number string")
         
-        try:
-            if num_str.startswith('$'):
-                if len(num_str) == 1:
-                    raise ValueError("Incomplete hexadecimal number (missing digits after '$')")
-                result = int(num_str[1:], 16)
-            elif num_str.startswith('0X'):
-                if len(num_str) == 2:
-                    raise ValueError("Incomplete hexadecimal number (missing digits after '0x')")
-                result = int(num_str, 16)
-            elif num_str.startswith('%'):
-                if len(num_str) == 1:
-                    raise ValueError("Incomplete binary number (missing digits after '%')")
-                result = int(num_str[1:], 2)
-            elif num_str.startswith('0B'):
-                if len(num_str) == 2:
-                    raise ValueError("Incomplete binary number (missing digits after '0b')")
-                result = int(num_str[2:], 2)
-            else:
-                # Check if it's a label
-                if num_str in self.labels:
-                    return self.labels[num_str]
-                # If it's not a number and not a defined label, try to parse as number
-                try:
-                    result = int(num_str)
-                except ValueError:
-                    # Check if it might be an undefined label (contains valid identifier characters)
-                    if self._is_valid_label(num_str):
-                        return 0  # Return 0 for undefined labels (forward references) during first pass
-                    else:
-                        raise ValueError(f"Invalid number format: '{num_str}' - expected decimal, hex ($xx), or binary (%bb)")
-            
-            # Validate range for 16-bit processor
-            if result < 0:
-                raise ValueError(f"Negative numbers not allowed: {result}")
-            elif result > 0xFFFF:
-                raise ValueError(f"Number too large for 16-bit processor: ${result:X} (max is $FFFF)")
-                
-            return result
+        # Defined labels resolve with a single lookup before any numeric parsing
+        label_value = self.labels.get(num_str)
+        if label_value is not None:
+            return label_value
+        
+        match = _NUM_RE.fullmatch(num_str)
+        if match:
+            kind = match.lastgroup
+            result = int(match.group(kind), _NUM_BASES[kind])
+        elif self._is_valid_label(num_str):
+            # Not a defined label (checked above), so treat it as a forward reference
+            return 0  # Return 0 for undefined labels (forward references) during first pass
+        else:
+            # Malformed literal: work out which error to report
+            if num_str == '$':
+                raise ValueError("Incomplete hexadecimal number (missing digits after '$')")
+            if num_str == '0X':
+                raise ValueError("Incomplete hexadecimal number (missing digits after '0x')")
+            if num_str == '%':
+                raise ValueError("Incomplete binary number (missing digits after '%')")
+            if num_str == '0B':
+                raise ValueError("Incomplete binary number (missing digits after '0b')")
+            if num_str.startswith(('$', '0X')):
+                raise ValueError(f"Invalid hexadecimal number: '{num_str}' - contains invalid characters")
+            if num_str.startswith(('%', '0B')):
+                raise ValueError(f"Invalid binary number: '{num_str}' - contains invalid characters")
+            if num_str[0] == '-' and num_str[1:].isdigit():
+                raise ValueError(f"Negative numbers not allowed: {int(num_str)}")
+            raise ValueError(f"Invalid number format: '{num_str}' - expected decimal, hex ($xx), or binary (%bb)")
+        
+        # Validate range for 16-bit processor
+        if result > 0xFFFF:
+            raise ValueError(f"Number too large for 16-bit processor: ${result:X} (max is $FFFF)")
             
-        except ValueError as e:
-            if "invalid literal" in str(e).lower():
-                # Improve error message for invalid digit errors
-                if num_str.startswith('$') or num_str.startswith('0X'):
-                    raise ValueError(f"Invalid hexadecimal number: '{num_str}' - contains invalid characters")
-                elif num_str.startswith('%') or num_str.startswith('0B'):
-                    raise ValueError(f"Invalid binary number: '{num_str}' - contains invalid characters")
-                else:
-                    raise ValueError(f"Invalid decimal number: '{num_str}' - contains invalid characters")
-            else:
-                raise  # Re-raise our custom error messages
+        return result
     
     def _is_branch_target(self, operand: str) -> bool:
         """Check if operand is a branch target (label)."""
@@ -690,8 +849,6 @@ class M6800Assembler:
     
     def _calculate_instruction_size(self, opcode: str, operands: List[str]) -> int:
         """Calculate the size of an instruction in bytes."""
-        instruction_def = self.instruction_set[opcode]
-        
         # Special handling for M6811 bit manipulation instructions
         if opcode in ['BSET', 'BCLR', 'BRSET', 'BRCLR']:
             try:
@@ -705,17 +862,16 @@ class M6800Assembler:
         
         # --- START REVISED INHERENT INSTRUCTION HANDLING ---
         if not operands:
-            if 'INH' not in instruction_def:
-                raise ValueError(f"Instruction {opcode} requires an explicit operand or addressing mode.")
-                
-            opcode_info = instruction_def['INH']
+            opcode_entry = self._inh_scalar.get(opcode)
             opcode_size = 1 # Default for 1-byte inherent
             
-            if isinstance(opcode_info, dict):
+            if opcode_entry is None:
+                if opcode not in self._inh_reg:
+                    raise ValueError(f"Instruction {opcode} requires an explicit operand or addressing mode.")
+                
                 # This branch means the 'INH' definition is a dictionary,
                 # implying it can take an implicit A or B accumulator.
-                if opcode in ['ASL', 'ASR', 'LSR', 'ROL', 'ROR', 
-                              'INC', 'DEC', 'CLR', 'TST', 'NEG', 'COM']:
+                if opcode in _SHIFT_LIKE:
                     opcode_size = 1 # These are 1-byte instructions.
                 elif opcode in ['PSH', 'PUL']:
                     raise ValueError(f"Instruction {opcode} requires accumulator (A or B) specified for inherent mode.")
@@ -723,21 +879,24 @@ class M6800Assembler:
                     raise ValueError(f"Ambiguous inherent instruction {opcode} (no explicit register for dict-based INH).")
             else:
                 # Handles truly inherent instructions with direct integer opcodes (1, 2, or 3 bytes)
-                if opcode_info > 0xFFFF:  # 3-byte opcode
-                    opcode_size = 3
-                elif opcode_info > 0xFF:  # 2-byte opcode
-                    opcode_size = 2
-                else:  # 1-byte opcode
-                    opcode_size = 1
+                opcode_size = opcode_entry[1]
             
             return opcode_size
         # --- END REVISED INHERENT INSTRUCTION HANDLING ---
 
+        # Sizes of value-independent modes are memoized per operand text. DIR/EXT
+        # depend on the resolved address (and on which labels are known yet), so
+        # those are never cached.
+        cache_key = (opcode, tuple(operands))
+        cached_size = self._size_cache.get(cache_key)
+        if cached_size is not None:
+            return cached_size
+        
         # Handle instructions with explicit operands (e.g., LDA #$55, CMP A #$55)
         register = None
         operand_start = 0
-        if len(operands) > 0 and operands[0].upper() in ['A', 'B']:
-            register = operands[0].upper()
+        if len(operands) > 0 and operands[0] in ('A', 'B'):
+            register = operands[0]
             operand_start = 1
         
         # Get the actual operand (skip register if present)
@@ -747,7 +906,7 @@ class M6800Assembler:
             operand = ''
         
         # Special handling for instructions that might need default register
-        if not register and operand and opcode in ['CMP', 'ADC', 'ADD', 'AND', 'BIT', 'EOR', 'ORA', 'SBC', 'SUB']:
+        if not register and operand and opcode in _DEFAULT_A:
             # Default to accumulator A for comparison and arithmetic operations
             register = 'A'
 
@@ -755,13 +914,9 @@ class M6800Assembler:
         
         # Get base opcode size (could be 1, 2, or 3 bytes for M6811 prefixed ops)
         opcode_size = 1
-        if addressing_mode in instruction_def:
-            opcode_val = instruction_def[addressing_mode]
-            if isinstance(opcode_val, int):
-                if opcode_val > 0xFFFF:  # 3-byte opcode
-                    opcode_size = 3
-                elif opcode_val > 0xFF:  # 2-byte opcode
-                    opcode_size = 2
+        opcode_entry = self._opcode_meta[opcode].get(addressing_mode)
+        if opcode_entry is not None and not isinstance(opcode_entry, dict):
+            opcode_size = opcode_entry[1]
         
         # Calculate total size based on addressing mode and operand bytes
         size_map = {
@@ -776,30 +931,26 @@ class M6800Assembler:
         size = size_map.get(addressing_mode, opcode_size)
         
         # Special cases for 16-bit immediate addressing (requires 2 bytes for the value)
-        if addressing_mode == 'IMM' and opcode in ['LDX', 'LDS', 'CPX', 'LDD', 'LDY', 'CPD', 'CPY', 'ADDD']:
+        if addressing_mode == 'IMM' and opcode in _IMM16_OPCODES:
             size += 1  # Additional byte for 16-bit immediate
+        
+        if addressing_mode not in ('DIR', 'EXT'):
+            self._size_cache[cache_key] = size
             
         return size
     
     def _clean_line(self, line: str) -> str:
         """Clean a line by removing comments and extra whitespace."""
-        # Remove comments
-        if ';' in line:
-            line = line[:line.index(';')]
-        return line.strip()
+        # Remove comments (everything from the first ';')
+        return line.partition(';')[0].strip()
     
     def _is_valid_label(self, label: str) -> bool:
         """Check if a string is a valid label name."""
-        if not label:
-            return False
-        # Labels should start with letter or underscore and contain only alphanumeric chars and underscores
-        if not (label[0].isalpha() or label[0] == '_'):
-            return False
-        return all(c.isalnum() or c == '_' for c in label)
+        return self._LABEL_RE.fullmatch(label) is not None
     
     def _format_object_code(self) -> str:
         """Format the object code for display."""
-        if not self.assembled_lines:
+        if not self._addresses:
             return ""
         
         lines = []
@@ -808,41 +959,32 @@ class M6800Assembler:
         lines.append(f"Origin Address: ${self.origin_address:04X}")
         lines.append("")
         
-        current_addr = None
-        hex_line = ""
-        addr_line = ""
+        # Gather contiguous runs of bytes, then emit 16-byte rows with bytes.hex()
+        runs = []
+        run_start = None
+        run = bytearray()
         
-        for item in self.assembled_lines:
-            addr = int(item['address'].replace('$', ''), 16)
-            hex_bytes = item['object_code'].replace(' ', '')
-            
-            if current_addr is None:
-                current_addr = addr
-                addr_line = f"{addr:04X}: "
-                hex_line = ""
-            
-            # If address is not consecutive, start a new line
-            if addr != current_addr:
-                if hex_line:
-                    lines.append(addr_line + hex_line)
-                current_addr = addr
-                addr_line = f"{addr:04X}: "
-                hex_line = ""
+        for addr, object_bytes in zip(self._addresses, self._obj_bytes):
+            # If address is not consecutive, start a new run
+            if run_start is None or addr != run_start + len(run):
+                if run:
+                    runs.append((run_start, run))
+                run_start = addr
+                run = bytearray()
             
-            # Add hex bytes to current line
-            for i in range(0, len(hex_bytes), 2):
-                hex_line += hex_bytes[i:i+2] + " "
-                current_addr += 1
-                
-                # Limit to 16 bytes per line
-                if len(hex_line.split()) >= 16:
-                    lines.append(addr_line + hex_line.strip())
-                    addr_line = f"{current_addr:04X}: "
-                    hex_line = ""
-        
-        # Add any remaining hex data
-        if hex_line:
-            lines.append(addr_line + hex_line.strip())
+            run += object_bytes
+        
+        if run:
+            runs.append((run_start, run))
+        
+        addr_hex = _addr_hex_table()
+        for run_start, run in runs:
+            # Limit to 16 bytes per line
+            for offset in range(0, len(run), 16):
+                row_addr = run_start + offset
+                # A run can spill past $FFFF; those rows fall back to formatting
+                prefix = addr_hex[row_addr] if row_addr <= 0xFFFF else f"{row_addr:04X}"
+                lines.append(prefix + ": " + run[offset:offset + 16].hex(' ').upper())
             
         return '\n'.join(lines)
     
@@ -850,14 +992,9 @@ class M6800Assembler:
         """Get object data as address -> byte mapping."""
         object_data = {}
         
-        for item in self.assembled_lines:
-            addr = int(item['address'].replace('$', ''), 16)
-            hex_bytes = item['object_code'].replace(' ', '')
-            
-            for i in range(0, len(hex_bytes), 2):
-                byte_value = int(hex_bytes[i:i+2], 16)
-                object_data[addr] = byte_value
-                addr += 1
+        for addr, object_bytes in zip(self._addresses, self._obj_bytes):
+            for offset, byte_value in enumerate(object_bytes):
+                object_data[addr + offset] = byte_value
                 
         return object_data
     
@@ -1002,23 +1139,7 @@ LABEL NOP     ; Label definition
 
     def _get_4letter_mapping(self) -> Dict[str, str]:
         """Get mapping of 4-letter M6800 instructions to 3-letter equivalents."""
-        return {
-            # 4-letter syntax -> 3-letter syntax
-            'LDAA': 'LDA',  'LDAB': 'LDB',  'LDAX': 'LDX',  'LDAS': 'LDS',
-            'STAA': 'STA',  'STAB': 'STB',  'STAX': 'STX',  'STAS': 'STS',
-            'ADDA': 'ADD',  'ADDB': 'ADD',  'ADCA': 'ADC',  'ADCB': 'ADC',
-            'SUBA': 'SUB',  'SUBB': 'SUB',  'SBCA': 'SBC',  'SBCB': 'SBC',
-            'ANDA': 'AND',  'ANDB': 'AND',  'EORA': 'EOR',  'EORB': 'EOR',
-            'ORAA': 'ORA',  'ORAB': 'ORB',  'BITA': 'BIT',  'BITB': 'BIT',
-            'CMPA': 'CMP',  'CMPB': 'CMP',  'CPXA': 'CPX',  'CPXB': 'CPX',
-            'TSTA': 'TST',  'TSTB': 'TST',  'CLRA': 'CLR',  'CLRB': 'CLR',
-            'COMA': 'COM',  'COMB': 'COM',  'NEGA': 'NEG',  'NEGB': 'NEG',
-            'INCA': 'INC',  'INCB': 'INC',  'DECA': 'DEC',  'DECB': 'DEC',
-            'ASLA': 'ASL',  'ASLB': 'ASL',  'ASRA': 'ASR',  'ASRB': 'ASR',
-            'LSRA': 'LSR',  'LSRB': 'LSR',  'ROLA': 'ROL',  'ROLB': 'ROL',
-            'RORA': 'ROR',  'RORB': 'ROR',  'PSHA': 'PSH',  'PSHB': 'PSH',
-            'PULA': 'PUL',  'PULB': 'PUL',
-        }
+        return _FOUR_LETTER_MAP
 
     def _parse_instruction_operands(self, opcode: str, tokens: List[str]) -> List[str]:
         """
@@ -1110,9 +1231,10 @@ LABEL NOP     ; Label definition
             raise ValueError(f"Bit mask ${mask_value:X} too large (max is $FF)")
             
         # Determine addressing mode from address operand
-        if ',X' in addr_operand.upper():
+        offset_str, sep, index_reg = addr_operand.rpartition(',')
+        if sep and index_reg in ('X', 'x'):
             # Indexed addressing
-            offset_str = addr_operand.upper().replace(',X', '').strip()
+            offset_str = offset_str.strip()
             address_or_offset = self._parse_number(offset_str) if offset_str else 0
             if address_or_offset > 0xFF:
                 raise ValueError(f"Indexed offset ${address_or_offset:X} too large (max is $FF)")
@@ -1134,9 +1256,8 @@ LABEL NOP     ; Label definition
                 raise ValueError(f"Instruction {opcode} requires three operands: address, bit mask, and branch target")
                 
             branch_target_str = operands[2].strip()
-            if branch_target_str.upper() in self.labels:
-                branch_target = self.labels[branch_target_str.upper()]
-            else:
+            branch_target = self.labels.get(branch_target_str)
+            if branch_target is None:
                 branch_target = self._parse_number(branch_target_str)
             size = 4  # Add branch offset byte
             
@@ -9,18 +9,72 @@ Main application entry point with Tkinter GUI interface.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox, scrolledtext, font as tkfont
 import os
 import sys
+import concurrent.futures
+import hashlib
+import atexit
+import collections
 import logging
+import logging.handlers
+import queue
 import re
+import shutil
+import subprocess
 from datetime import datetime
 from m6800_assembler import M6800Assembler
 from simulator import M6800Simulator
 
+# Debug tracing is on unless M6800_DEBUG=0 is set in the environment
+DEBUG = os.environ.get('M6800_DEBUG', '1') != '0'
+
+# Optional linear-time regex engine (pip install google-re2) for highlighting;
+# the standard re module is used when it isn't installed
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# The 'AssemblerGUI' logger is shared by every window, so a single queue
+# listener writes its records; setting up logging again replaces it
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Stop the log listener, writing out queued records, and close its handlers."""
+    global _log_listener
+    listener, _log_listener = _log_listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        # Closing the memory buffer flushes it but leaves its file open
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+
+
+atexit.register(_stop_log_listener)
+
 class SyntaxHighlighter:
     """Syntax highlighter for M6800 assembly language."""
     
+    # Lines highlighted above and below the visible area
+    VIEWPORT_MARGIN = 20
+    
+    # Tagged lines further than this outside the visible area are untagged,
+    # so the number of tag ranges stays bounded in long files
+    EVICT_DISTANCE = 200
+    
+    # Every tag the highlighter applies
+    TAGS = ('comment', 'instruction', 'directive', 'label', 'number',
+            'register', 'string', 'address', 'operator')
+    
+    # (patterns, word_tags, group_tags, master_pattern), built on first use
+    _COMPILED = None
+    
     def __init__(self, text_widget):
         self.text_widget = text_widget
         self.setup_tags()
@@ -28,6 +82,10 @@ class SyntaxHighlighter:
         # Define syntax patterns
         self.define_patterns()
         
+        # Lines tagged since the last full reset, and the line count they refer to
+        self._highlighted_lines = set()
+        self._highlighted_line_count = 0
+        
     def setup_tags(self):
         """Set up text tags for different syntax elements."""
         # Comments - green
@@ -59,6 +117,15 @@ class SyntaxHighlighter:
         
     def define_patterns(self):
         """Define regex patterns for syntax highlighting."""
+        # The tables and the combined pattern are the same for every editor,
+        # so they are built once and shared by all instances
+        if SyntaxHighlighter._COMPILED is None:
+            SyntaxHighlighter._COMPILED = self._compile_patterns()
+        self.patterns, self.word_tags, self.group_tags, self.master_pattern = SyntaxHighlighter._COMPILED
+    
+    @staticmethod
+    def _compile_patterns():
+        """Build (patterns, word_tags, group_tags, master_pattern)."""
         # M6800 instruction set (comprehensive list from assembler)
         instructions = [
             'ABA', 'ADC', 'ADD', 'AND', 'ASL', 'ASR',
@@ -91,7 +158,7 @@ class SyntaxHighlighter:
         registers = ['A', 'B', 'X', 'Y', 'SP', 'PC', 'CC', 'D']
         
         # Create patterns
-        self.patterns = [
+        patterns = [
             # Comments (highest priority)
             (r';.*$', 'comment'),
             
@@ -100,13 +167,15 @@ class SyntaxHighlighter:
             (r"'[^']*'", 'string'),
             
             # Labels (word followed by colon)
-            (r'^\s*([A-Za-z_][A-Za-z0-9_]*):(?!:)', 'label'),
+            (r'^\s*(?:[A-Za-z_][A-Za-z0-9_]*):', 'label'),
             
-            # Directives
-            (fr'\b(?:{"|".join(directives)})\b', 'directive'),
+            # Words: directives, instructions and registers are told apart by a
+            # table lookup rather than a long regex alternation
+            (r'\b[A-Za-z_][A-Za-z0-9_]*\b', 'word'),
             
-            # Instructions (case insensitive)
-            (fr'\b(?:{"|".join(instructions)})\b', 'instruction'),
+            # Memory addressing (before numbers, which would otherwise claim the offset)
+            (r'\b[0-9]+,X\b', 'address'),        # Indexed addressing
+            (r'\b[0-9]+,Y\b', 'address'),        # Indexed addressing with Y
             
             # Numbers (various formats)
             (r'\$[0-9A-Fa-f]+', 'number'),        # Hexadecimal $XX
@@ -114,34 +183,129 @@ class SyntaxHighlighter:
             (r'\b[0-9]+\b', 'number'),           # Decimal
             (r'0x[0-9A-Fa-f]+', 'number'),        # Hex 0xXX
             
-            # Memory addressing and operators
+            # Operators
             (r'[,()#+\-]', 'operator'),           # Addressing operators
-            (r'\b[0-9]+,X\b', 'address'),        # Indexed addressing
-            (r'\b[0-9]+,Y\b', 'address'),        # Indexed addressing with Y
-            
-            # Registers (standalone)
-            (fr'\b(?:{"|".join(registers)})\b', 'register'),
         ]
         
-        # Compile regex patterns for better performance
-        self.compiled_patterns = [(re.compile(pattern, re.MULTILINE | re.IGNORECASE), tag) 
-                                 for pattern, tag in self.patterns]
+        # Tag for each recognised word (uppercase); directives take precedence
+        # over instructions, and instructions over registers
+        word_tags = {}
+        for words, tag in ((registers, 'register'), (instructions, 'instruction'), (directives, 'directive')):
+            word_tags.update(dict.fromkeys(words, tag))
+        
+        # Combine all patterns into one alternation so the text is scanned once.
+        # Alternatives are tried in list order, so earlier entries win (comments
+        # and strings swallow anything inside them). Group names must be unique,
+        # so each is suffixed with its index and mapped back to its tag.
+        group_tags = {}
+        alternatives = []
+        for i, (pattern, tag) in enumerate(patterns):
+            group = f"{tag}_{i}"
+            group_tags[group] = tag
+            alternatives.append(f"(?P<{group}>{pattern})")
+        # Flags are given inline so the same pattern compiles under re2 and re
+        master_source = '(?im)' + '|'.join(alternatives)
+        master_pattern = None
+        if re2 is not None:
+            try:
+                master_pattern = re2.compile(master_source)
+            except Exception:
+                master_pattern = None  # unsupported syntax; use re below
+        if master_pattern is None:
+            master_pattern = re.compile(master_source)
+        
+        return patterns, word_tags, group_tags, master_pattern
     
     def highlight_all(self):
-        """Apply syntax highlighting to the entire text."""
-        # Clear all existing tags
-        for tag in ['comment', 'instruction', 'directive', 'label', 'number', 'register', 'string', 'address', 'operator']:
-            self.text_widget.tag_remove(tag, '1.0', tk.END)
-        
-        # Get all text
-        content = self.text_widget.get('1.0', tk.END)
-        
-        # Apply patterns in order (comments first to avoid conflicts)
-        for pattern, tag in self.compiled_patterns:
-            for match in pattern.finditer(content):
-                start_idx = self._get_text_index(content, match.start())
-                end_idx = self._get_text_index(content, match.end())
-                self.text_widget.tag_add(tag, start_idx, end_idx)
+        """Re-apply syntax highlighting, tagging only the visible part of the text.
+        
+        Lines scrolled into view later are tagged by highlight_visible.
+        """
+        self.clear_tags()
+        self.highlight_visible()
+    
+    def clear_tags(self):
+        """Remove all highlighting from the text."""
+        # Deleting and re-creating the tags drops their ranges in one pass
+        # instead of walking the whole text once per tag
+        self.text_widget.tag_delete(*self.TAGS)
+        self.setup_tags()
+        self._highlighted_lines.clear()
+    
+    def highlight_visible(self):
+        """Tag the lines in (and just around) the viewport that aren't tagged yet."""
+        text = self.text_widget
+        line_count = int(text.index('end-1c').split('.')[0])
+        
+        first_line = int(text.index('@0,0').split('.')[0]) - self.VIEWPORT_MARGIN
+        last_line = int(text.index(f"@0,{text.winfo_height()}").split('.')[0]) + self.VIEWPORT_MARGIN
+        first_line = max(first_line, 1)
+        last_line = min(last_line, line_count)
+        
+        if line_count != self._highlighted_line_count:
+            # Lines were added or removed since tagging, so cached line numbers
+            # no longer line up with the text; re-tag whatever is visible and
+            # drop the tags elsewhere, which could no longer be evicted
+            self._highlighted_lines.clear()
+            self._highlighted_line_count = line_count
+            for tag in self.TAGS:
+                text.tag_remove(tag, '1.0', f"{first_line}.0")
+                text.tag_remove(tag, f"{last_line}.end", tk.END)
+        else:
+            # Untag lines that have drifted far out of view
+            keep_first = first_line - self.EVICT_DISTANCE
+            keep_last = last_line + self.EVICT_DISTANCE
+            far_lines = [line_num for line_num in self._highlighted_lines
+                         if line_num < keep_first or line_num > keep_last]
+            if far_lines:
+                self._untag_lines(far_lines)
+        
+        # Tag each contiguous run of untagged lines with one get() and one
+        # tag_remove() per tag
+        line_num = first_line
+        while line_num <= last_line:
+            if line_num in self._highlighted_lines:
+                line_num += 1
+                continue
+            run_start = line_num
+            while line_num <= last_line and line_num not in self._highlighted_lines:
+                line_num += 1
+            self._highlight_range(run_start, line_num - 1)
+    
+    def _untag_lines(self, lines):
+        """Remove the tags from the given lines, one tag_remove per tag and run."""
+        lines.sort()
+        runs = []
+        run_start = prev = lines[0]
+        for line_num in lines[1:]:
+            if line_num != prev + 1:
+                runs.append((run_start, prev))
+                run_start = line_num
+            prev = line_num
+        runs.append((run_start, prev))
+        
+        for tag in self.TAGS:
+            for run_start, run_end in runs:
+                self.text_widget.tag_remove(tag, f"{run_start}.0", f"{run_end}.end")
+        self._highlighted_lines.difference_update(lines)
+    
+    def _highlight_range(self, first_line, last_line):
+        """Re-tag the lines first_line..last_line (inclusive)."""
+        start_idx = f"{first_line}.0"
+        end_idx = f"{last_line}.end"
+        for tag in self.TAGS:
+            self.text_widget.tag_remove(tag, start_idx, end_idx)
+        
+        # Scan line by line so each match maps straight to a line.column index
+        # without any offset arithmetic
+        content = self.text_widget.get(start_idx, end_idx)
+        ranges = {}
+        for line_num, line_content in enumerate(content.split('\n'), first_line):
+            if line_content:
+                self._tag_matches(line_num, line_content, ranges)
+        self._add_tags(ranges)
+        
+        self._highlighted_lines.update(range(first_line, last_line + 1))
     
     def highlight_line(self, line_num):
         """Apply syntax highlighting to a specific line."""
@@ -151,27 +315,62 @@ class SyntaxHighlighter:
         line_content = self.text_widget.get(start_idx, end_idx)
         
         # Clear existing tags for this line
-        for tag in ['comment', 'instruction', 'directive', 'label', 'number', 'register', 'string', 'address', 'operator']:
+        for tag in self.TAGS:
             self.text_widget.tag_remove(tag, start_idx, end_idx)
         
-        # Apply patterns to this line
-        for pattern, tag in self.compiled_patterns:
-            for match in pattern.finditer(line_content):
-                match_start = f"{line_num}.{match.start()}"
-                match_end = f"{line_num}.{match.end()}"
-                self.text_widget.tag_add(tag, match_start, match_end)
+        # Apply the combined pattern to this line
+        ranges = {}
+        self._tag_matches(line_num, line_content, ranges)
+        self._add_tags(ranges)
+        self._highlighted_lines.add(line_num)
     
-    def _get_text_index(self, content, char_index):
-        """Convert character index to Tkinter text index (line.column)."""
-        lines_before = content[:char_index].count('\n')
-        line_start = content.rfind('\n', 0, char_index) + 1
-        column = char_index - line_start
-        return f"{lines_before + 1}.{column}"
+    def _tag_matches(self, line_num, line_content, ranges):
+        """Collect the index pairs of every syntax match within one line of text.
+        
+        ranges maps each tag to a flat [start, end, start, end, ...] list.
+        """
+        group_tags = self.group_tags
+        word_tags = self.word_tags
+        for match in self.master_pattern.finditer(line_content):
+            tag = group_tags[match.lastgroup]
+            if tag == 'word':
+                tag = word_tags.get(match.group().upper())
+                if tag is None:
+                    continue  # plain identifier (e.g. a label reference)
+            pairs = ranges.get(tag)
+            if pairs is None:
+                pairs = ranges[tag] = []
+            pairs.append(f"{line_num}.{match.start()}")
+            pairs.append(f"{line_num}.{match.end()}")
+    
+    def _add_tags(self, ranges):
+        """Apply collected tag ranges with one Tcl call per tag."""
+        # "tag add" takes any number of index pairs; calling Tcl directly
+        # skips the per-match round trip through Text.tag_add
+        text = self.text_widget
+        for tag, pairs in ranges.items():
+            text.tk.call(text._w, 'tag', 'add', tag, *pairs)
 
 class AssemblerGUI:
+    # Maps each byte to itself if printable ASCII, otherwise to '.'
+    _MEM_ASCII = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
+    
+    # Byte index (0-15) under each column of a memory viewer row, or -1;
+    # the hex area spans columns 8-55 with 3 columns (XX ) per byte
+    _MEM_COL_TO_BYTE = tuple((c - 8) // 3 if 8 <= c <= 55 else -1 for c in range(80))
+    
+    # Memory viewer page layout: header, one row per 16 bytes (address, hex
+    # column 47 wide, ASCII column) and a footer taking the shown range
+    _MEM_HEADER = (b"Address  +0 +1 +2 +3 +4 +5 +6 +7 +8 +9 +A +B +C +D +E +F  ASCII\n"
+                   + b"-" * 72 + b"\n")
+    _MEM_ROW_FMT = b"%04X:   %-47s  %-16s\n"
+    _MEM_FOOTER = (b"\n" + b"=" * 72 + b"\n"
+                   + "Instructions: Double-click on hex values to edit • Use Go/Search to navigate\n".encode('utf-8')
+                   + b"Showing: $%04X - $%04X")
+    
     def __init__(self, root):
         self.setup_logging()
-        self.debug_print("🚀 DEBUG: AssemblerGUI.__init__() called")
+        self.debug_print("[START] DEBUG: AssemblerGUI.__init__() called")
         self.root = root
         self.root.title("Motorola 6800 Assembler - Interactive Interface")
         self.root.geometry("1200x800")
@@ -181,101 +380,196 @@ class AssemblerGUI:
         style = ttk.Style()
         style.theme_use('clam')  # Modern looking theme
         
-        # Initialize assembler and simulator
-        self.debug_print("🚀 DEBUG: Initializing assembler and simulator")
+        # Initialize assembler; the simulator (and its log file) is only
+        # created once it is first used
+        self.debug_print("[START] DEBUG: Initializing assembler")
         self.assembler = M6800Assembler()
-        self.simulator = M6800Simulator()
+        self._simulator = None
+        
+        # Assembly runs on one worker thread so the UI stays responsive; a
+        # single worker also keeps runs from sharing the assembler at once
+        self._assemble_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        
+        # Pending assemblies as [future, key, callbacks], in request order, so
+        # results are shown in the order they were asked for
+        self._asm_queue = collections.deque()
+        
+        # Digest of the last assembled source and its result
+        self._asm_cache_key = None
+        self._asm_cache = None
+        
+        # (source log stamps, path) of the last combined log written
+        self._combined_log_cache = None
+        
+        # Instruction reference window and its text, created on first use
+        self._instruction_window = None
+        self._instr_ref_text = None
+        
+        # Memory viewer window, created on first use
+        self._memory_window = None
         
         self.setup_gui()
         self.current_file = None
-        self.debug_print("🚀 DEBUG: GUI initialization completed")
+        self.debug_print("[START] DEBUG: GUI initialization completed")
+        
+    @property
+    def simulator(self):
+        """The simulator, created on first access with the current tracing setting."""
+        if self._simulator is None:
+            self.debug_print("[START] DEBUG: Initializing simulator")
+            simulator = M6800Simulator()
+            simulator._debug_on = self._debug_on
+            simulator.logger.setLevel(self.logger.level)
+            self._simulator = simulator
+        return self._simulator
         
     def setup_logging(self):
         """Set up logging to save debug output to timestamped files."""
+        global _log_listener
         # Create logs directory if it doesn't exist
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
+        os.makedirs('logs', exist_ok=True)
         
         # Generate timestamped log filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_filename = f"logs/gui_debug_{timestamp}.log"
         
         # Set up logger
+        self._debug_on = DEBUG
         self.logger = logging.getLogger('AssemblerGUI')
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
         
         # Remove any existing handlers
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
         
-        # Create file handler
-        file_handler = logging.FileHandler(self.log_filename, mode='w', encoding='utf-8')
+        # Create file handler; the log rolls over at 10 MB and keeps up to
+        # 10 old files, and is not opened until the first record is written
+        file_handler = logging.handlers.RotatingFileHandler(
+            self.log_filename, maxBytes=10_000_000, backupCount=10,
+            encoding='utf-8', delay=True)
         file_handler.setLevel(logging.DEBUG)
         
         # Create formatter
         formatter = logging.Formatter('%(asctime)s - %(message)s', datefmt='%H:%M:%S')
         file_handler.setFormatter(formatter)
         
-        # Add handler to logger
-        self.logger.addHandler(file_handler)
+        # Debug traces go to the file only; the console gets INFO and above
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        
+        # Buffer records in memory and write them in batches; errors are
+        # flushed straight away so they always reach the file
+        self._log_buffer = logging.handlers.MemoryHandler(
+            512, flushLevel=logging.ERROR, target=file_handler)
+        
+        # Add handler to logger; records are queued and written to the file
+        # by a background thread, keeping disk IO out of the calling code
+        _stop_log_listener()
+        log_queue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, self._log_buffer, console_handler, respect_handler_level=True)
+        _log_listener.start()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
         
         # Log startup
-        self.debug_print("🚀 M6800 Assembler GUI Debug Log Started")
-        self.debug_print(f"📁 Log file: {self.log_filename}")
-        
-    def debug_print(self, message: str):
-        """Print debug message and log to file."""
-        print(message)  # Console output
-        self.logger.debug(message)  # File output
-        
+        self.debug_print("[START] M6800 Assembler GUI Debug Log Started")
+        self.debug_print(f"[LOG] Log file: {self.log_filename}")
+        
+    def debug_print(self, message: str, *args):
+        """Log a debug message; %-style args are only formatted when tracing is on."""
+        if not self._debug_on:
+            return
+        self.logger.debug(message, *args)
+        
+    def toggle_debug_tracing(self):
+        """Turn debug tracing on/off for the GUI and the simulator."""
+        enabled = self.debug_tracing_var.get()
+        level = logging.DEBUG if enabled else logging.WARNING
+        # A simulator that doesn't exist yet picks the setting up when created
+        for owner in (self, self._simulator):
+            if owner is None:
+                continue
+            owner._debug_on = enabled
+            owner.logger.setLevel(level)
+        self.status_var.set(f"Debug tracing {'enabled' if enabled else 'disabled'}")
+    
     def get_log_files(self):
         """Get paths to all log files."""
         log_files = {
             'gui': self.log_filename,
-            'simulator': getattr(self.simulator, 'log_filename', None)
+            'simulator': getattr(self._simulator, 'log_filename', None)
         }
         return log_files
         
+    @staticmethod
+    def _log_stamp(path):
+        """Return (mtime_ns, size) for a log file, or None if it doesn't exist."""
+        if not path:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+        
     def create_combined_log(self):
         """Create a combined log file with all debug information."""
         try:
+            # Write out any queued or buffered records before copying the
+            # logs; stopping a listener handles everything queued so far
+            if _log_listener is not None:
+                _log_listener.stop()
+                _log_listener.start()
+            self._log_buffer.flush()
+            if self._simulator is not None:
+                self._simulator.flush_log()
+            
+            # Reuse the last combined log if neither source log has changed
+            sim_log_file = getattr(self._simulator, 'log_filename', None)
+            stamps = (self._log_stamp(self.log_filename), self._log_stamp(sim_log_file))
+            cached = self._combined_log_cache
+            if cached and cached[0] == stamps and os.path.exists(cached[1]):
+                return cached[1]
+            
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             combined_filename = f"logs/combined_session_{timestamp}.log"
+            os.makedirs('logs', exist_ok=True)
             
-            with open(combined_filename, 'w', encoding='utf-8') as combined_file:
-                combined_file.write("=" * 80 + "\n")
-                combined_file.write("M6800 ASSEMBLER & SIMULATOR - COMBINED DEBUG LOG\n")
-                combined_file.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                combined_file.write("=" * 80 + "\n\n")
+            # Work in binary mode so the logs are copied as raw bytes with no
+            # decode/encode round trip; both sources are UTF-8 already. The
+            # large buffer coalesces the banner and section header writes
+            with open(combined_filename, 'wb', buffering=1 << 20) as combined_file:
+                combined_file.write((
+                    "=" * 80 + "\n"
+                    "M6800 ASSEMBLER & SIMULATOR - COMBINED DEBUG LOG\n"
+                    f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    + "=" * 80 + "\n\n").encode('utf-8'))
                 
                 # Add GUI log
                 if os.path.exists(self.log_filename):
-                    combined_file.write("GUI DEBUG LOG:\n")
-                    combined_file.write("-" * 40 + "\n")
-                    with open(self.log_filename, 'r', encoding='utf-8') as gui_log:
-                        combined_file.write(gui_log.read())
-                    combined_file.write("\n\n")
+                    combined_file.write(b"GUI DEBUG LOG:\n" + b"-" * 40 + b"\n")
+                    with open(self.log_filename, 'rb') as gui_log:
+                        shutil.copyfileobj(gui_log, combined_file, 1 << 20)
+                    combined_file.write(b"\n\n")
                 
                 # Add simulator log
-                sim_log_file = getattr(self.simulator, 'log_filename', None)
                 if sim_log_file and os.path.exists(sim_log_file):
-                    combined_file.write("SIMULATOR DEBUG LOG:\n")
-                    combined_file.write("-" * 40 + "\n")
-                    with open(sim_log_file, 'r', encoding='utf-8') as sim_log:
-                        combined_file.write(sim_log.read())
-                    combined_file.write("\n\n")
+                    combined_file.write(b"SIMULATOR DEBUG LOG:\n" + b"-" * 40 + b"\n")
+                    with open(sim_log_file, 'rb') as sim_log:
+                        shutil.copyfileobj(sim_log, combined_file, 1 << 20)
+                    combined_file.write(b"\n\n")
                 
-                combined_file.write("=" * 80 + "\n")
-                combined_file.write("END OF COMBINED LOG\n")
-                combined_file.write("=" * 80 + "\n")
+                combined_file.write(b"=" * 80 + b"\nEND OF COMBINED LOG\n" + b"=" * 80 + b"\n")
             
-            self.debug_print(f"📋 DEBUG: Combined log created: {combined_filename}")
+            self._combined_log_cache = (stamps, combined_filename)
+            self.debug_print(f"[LOG] DEBUG: Combined log created: {combined_filename}")
             return combined_filename
             
         except Exception as e:
-            self.debug_print(f"❌ DEBUG: Failed to create combined log: {e}")
+            self.debug_print(f"[ERROR] DEBUG: Failed to create combined log: {e}")
             return None
-        
+    
     def setup_gui(self):
         """Set up the main GUI layout."""
         # Create main menu
@@ -339,6 +633,10 @@ class AssemblerGUI:
         debug_menu.add_command(label="View Log Files", command=self.show_log_files)
         debug_menu.add_command(label="Create Combined Log", command=self.create_and_show_combined_log)
         debug_menu.add_command(label="Open Logs Folder", command=self.open_logs_folder)
+        debug_menu.add_separator()
+        self.debug_tracing_var = tk.BooleanVar(value=self._debug_on)
+        debug_menu.add_checkbutton(label="Debug Tracing", variable=self.debug_tracing_var,
+                                   command=self.toggle_debug_tracing)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -365,6 +663,8 @@ class AssemblerGUI:
         self.line_numbers = tk.Text(text_frame, width=4, padx=3, takefocus=0,
                                    border=0, state='disabled', wrap='none')
         self.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
+        self._last_line_count = 0  # editor line count the numbers were drawn for
+        self._line_numbers_pending = False
         
         # Assembly code text area
         self.assembly_text = scrolledtext.ScrolledText(text_frame, wrap=tk.NONE, 
@@ -374,12 +674,38 @@ class AssemblerGUI:
         # Initialize syntax highlighter
         self.syntax_highlighter = SyntaxHighlighter(self.assembly_text)
         
-        # Bind events for line numbering and syntax highlighting
-        self.assembly_text.bind('<Any-KeyPress>', self.on_text_change)
-        self.assembly_text.bind('<Button-1>', self.update_line_numbers)
-        self.assembly_text.bind('<MouseWheel>', self.update_line_numbers)
+        # Lines edited since the last focus-out re-highlight; multi-line edits
+        # (new/removed lines, paste, cut, undo) fall back to a full pass
+        self._dirty_lines = set()
+        self._full_highlight_pending = False
+        self._highlight_line_count = None
+        
+        # Pending debounced highlight of the cursor line while typing
+        self._hl_after_id = None
+        
+        # Mirror of the highlight checkbox, so event handlers don't have to
+        # query the Tcl variable
+        self._hl_on = True
+        
+        # A viewport highlight pass is queued
+        self._visible_hl_pending = False
+        
+        # Bind events for line numbering and syntax highlighting; line
+        # numbers are only refreshed by edits that can change the line count,
+        # not by every key press
+        for sequence in ('<Return>', '<KP_Enter>', '<BackSpace>', '<Delete>'):
+            self.assembly_text.bind(sequence, self.update_line_numbers)
         self.assembly_text.bind('<KeyRelease>', self.on_key_release)
+        self.assembly_text.bind('<KeyRelease>', self.on_line_count_key_release, add='+')
         self.assembly_text.bind('<FocusOut>', self.on_focus_out)
+        for sequence in ('<<Paste>>', '<<Cut>>', '<<Undo>>', '<<Redo>>'):
+            self.assembly_text.bind(sequence, self.on_bulk_edit, add='+')
+            self.assembly_text.bind(sequence, self.update_line_numbers, add='+')
+        
+        # Every scroll or resize passes through yscrollcommand; use it to tag
+        # lines as they come into view
+        self._scrollbar_set = self.assembly_text.vbar.set
+        self.assembly_text.configure(yscrollcommand=self.on_text_scroll)
         
         # Control buttons
         button_frame = ttk.Frame(parent)
@@ -387,8 +713,9 @@ class AssemblerGUI:
         
         ttk.Button(button_frame, text="Load Example", 
                   command=self.load_example).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="Assemble (F5)", 
-                  command=self.assemble_code).pack(side=tk.LEFT, padx=(0, 5))
+        self.assemble_button = ttk.Button(button_frame, text="Assemble (F5)", 
+                                          command=self.assemble_code)
+        self.assemble_button.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="Clear", 
                   command=self.clear_input).pack(side=tk.LEFT)
         
@@ -402,273 +729,473 @@ class AssemblerGUI:
         # Add some example code initially
         self.load_example()
         
-    def on_text_change(self, event=None):
-        """Handle text change events for line numbering."""
-        self.update_line_numbers(event)
-        
     def on_key_release(self, event=None):
         """Handle key release events for syntax highlighting."""
-        if self.highlight_enabled.get():
-            # Get the current line number
-            cursor_pos = self.assembly_text.index(tk.INSERT)
-            line_num = int(cursor_pos.split('.')[0])
-            
-            # For efficiency, only highlight current line on key release
-            # Full highlighting happens on focus out or manual trigger
-            self.root.after_idle(lambda: self.syntax_highlighter.highlight_line(line_num))
+        # Get the current line number
+        cursor_pos = self.assembly_text.index(tk.INSERT)
+        line_num = int(cursor_pos.split('.')[0])
+        self._dirty_lines.add(line_num)
+        
+        # A changed line count means lines were split or joined, which shifts
+        # the numbers of every dirty line after it
+        line_count = int(self.assembly_text.index('end-1c').split('.')[0])
+        if self._highlight_line_count is not None and line_count != self._highlight_line_count:
+            self._full_highlight_pending = True
+        self._highlight_line_count = line_count
+        
+        # For efficiency, only highlight the current line once typing pauses
+        # Full highlighting happens on focus out or manual trigger
+        if self._hl_after_id:
+            self.root.after_cancel(self._hl_after_id)
+        self._hl_after_id = self.root.after(80, self._do_hl_current)
+    
+    def on_line_count_key_release(self, event=None):
+        """Refresh line numbers after a key release that changed the line count.
+        
+        Typing over a multi-line selection joins lines without any of the keys
+        bound to update_line_numbers. This stays bound while syntax
+        highlighting is off.
+        """
+        line_count = int(self.assembly_text.index('end-1c').split('.')[0])
+        if line_count != self._last_line_count:
+            self.update_line_numbers()
+    
+    def _do_hl_current(self):
+        """Highlight the line under the cursor after a pause in typing."""
+        self._hl_after_id = None
+        if self._hl_on:
+            line_num = int(self.assembly_text.index(tk.INSERT).split('.')[0])
+            self.syntax_highlighter.highlight_line(line_num)
     
     def on_focus_out(self, event=None):
-        """Handle focus out events for full syntax highlighting."""
-        if self.highlight_enabled.get():
+        """Handle focus out events by re-highlighting what was edited."""
+        if self._full_highlight_pending:
             self.root.after_idle(self.syntax_highlighter.highlight_all)
+        elif self._dirty_lines:
+            # Re-highlight edited lines plus one line of context on either side
+            lines = set()
+            for line_num in self._dirty_lines:
+                lines.update((line_num - 1, line_num, line_num + 1))
+            last_line = int(self.assembly_text.index('end-1c').split('.')[0])
+            for line_num in sorted(lines):
+                if 1 <= line_num <= last_line:
+                    self.root.after_idle(self.syntax_highlighter.highlight_line, line_num)
+        
+        self._dirty_lines = set()
+        self._full_highlight_pending = False
+    
+    def on_text_scroll(self, first, last):
+        """Update the scrollbar and highlight lines scrolled into view."""
+        self._scrollbar_set(first, last)
+        # A fast scroll or resize calls this many times before the UI is
+        # idle; they are folded into one pass over the final viewport
+        if self._hl_on and not self._visible_hl_pending:
+            self._visible_hl_pending = True
+            self.root.after_idle(self._highlight_visible)
+    
+    def _highlight_visible(self):
+        """Run a viewport highlight pass queued by on_text_scroll."""
+        self._visible_hl_pending = False
+        if self._hl_on:
+            self.syntax_highlighter.highlight_visible()
+    
+    def on_bulk_edit(self, event=None):
+        """Flag edits that may span many lines for a full re-highlight."""
+        self._full_highlight_pending = True
     
     def toggle_syntax_highlighting(self):
         """Toggle syntax highlighting on/off."""
-        if self.highlight_enabled.get():
+        self._hl_on = self.highlight_enabled.get()
+        
+        # Either way the tags are rebuilt or dropped wholesale, so pending
+        # per-line work is obsolete
+        if self._hl_after_id:
+            self.root.after_cancel(self._hl_after_id)
+            self._hl_after_id = None
+        self._dirty_lines = set()
+        self._full_highlight_pending = False
+        self._highlight_line_count = None
+        
+        if self._hl_on:
             # Enable highlighting
+            self.assembly_text.bind('<KeyRelease>', self.on_key_release)
+            self.assembly_text.bind('<KeyRelease>', self.on_line_count_key_release, add='+')
+            self.assembly_text.bind('<FocusOut>', self.on_focus_out)
             self.syntax_highlighter.highlight_all()
             self.status_var.set("Syntax highlighting enabled")
         else:
-            # Disable highlighting by removing all tags
-            for tag in ['comment', 'instruction', 'directive', 'label', 'number', 'register', 'string', 'address', 'operator']:
-                self.assembly_text.tag_remove(tag, '1.0', tk.END)
+            # Disable highlighting by removing all tags; the highlight handlers
+            # are unbound so keystrokes don't pay for them, leaving only the
+            # line count check on key release
+            self.assembly_text.bind('<KeyRelease>', self.on_line_count_key_release)
+            self.assembly_text.unbind('<FocusOut>')
+            self.syntax_highlighter.clear_tags()
             self.status_var.set("Syntax highlighting disabled")
     
     def update_line_numbers(self, event=None):
         """Update line numbers in the text widget."""
-        self.root.after_idle(self._update_line_numbers)
+        # Coalesce a burst of key presses (or key repeat) into one update
+        if not self._line_numbers_pending:
+            self._line_numbers_pending = True
+            self.root.after(50, self._update_line_numbers)
         
     def _update_line_numbers(self):
-        """Internal method to update line numbers."""
-        self.line_numbers.config(state='normal')
-        self.line_numbers.delete(1.0, tk.END)
+        """Bring the line number gutter in line with the editor's line count.
         
+        The gutter is left untouched when the count hasn't changed since the
+        last update, so most calls make no widget changes at all.
+        """
+        self._line_numbers_pending = False
         line_count = int(self.assembly_text.index('end-1c').split('.')[0])
-        line_numbers_text = '\n'.join(str(i) for i in range(1, line_count))
+        last_count = self._last_line_count
+        if line_count == last_count:
+            return
         
-        self.line_numbers.insert(1.0, line_numbers_text)
+        # Only add or remove the numbers at the end instead of rewriting them all
+        self.line_numbers.config(state='normal')
+        if line_count > last_count:
+            line_numbers_text = '\n'.join(map(str, range(max(last_count, 1), line_count)))
+            if last_count > 1:
+                line_numbers_text = '\n' + line_numbers_text
+            self.line_numbers.insert('end-1c', line_numbers_text)
+        elif line_count > 1:
+            self.line_numbers.delete(f"{line_count - 1}.end", tk.END)
+        else:
+            self.line_numbers.delete(1.0, tk.END)
         self.line_numbers.config(state='disabled')
+        self._last_line_count = line_count
+    
+    def run_assembly(self, assembly_code, on_done):
+        """Assemble in the worker thread and call on_done(result) on the UI thread.
+        
+        If assembly raises, on_done is called with the exception instead.
+        Unchanged source reuses the previous result without re-assembling,
+        and a request for the same source as the last queued run waits for
+        that run instead of starting another. Callbacks always run in request
+        order, so an older result never replaces a newer one.
+        """
+        key = hashlib.blake2b(assembly_code.encode('utf-8'), digest_size=16).digest()
+        jobs = self._asm_queue
+        if key == self._asm_cache_key and not jobs:
+            self.root.after_idle(on_done, self._asm_cache)
+            return
+        if jobs and jobs[-1][1] == key:
+            jobs[-1][2].append(on_done)
+            return
+        if key == self._asm_cache_key:
+            # Still has to wait for the runs queued ahead of it
+            future = concurrent.futures.Future()
+            future.set_result(self._asm_cache)
+        else:
+            future = self._assemble_executor.submit(self.assembler.assemble, assembly_code)
+        jobs.append([future, key, [on_done]])
+        if len(jobs) == 1:
+            self.assemble_button.state(['disabled'])
+            self.root.after(30, self._poll_assembly)
+    
+    def _poll_assembly(self):
+        """Hand finished assemblies back to their callbacks, or check again later."""
+        jobs = self._asm_queue
+        while jobs and jobs[0][0].done():
+            future, key, callbacks = jobs.popleft()
+            try:
+                result = future.result()
+            except Exception as e:
+                result = e
+            else:
+                self._asm_cache_key, self._asm_cache = key, result
+            for on_done in callbacks:
+                on_done(result)
+        if jobs:
+            self.root.after(30, self._poll_assembly)
+        else:
+            self.assemble_button.state(['!disabled'])
     
     def assemble_code(self):
         """Assemble the current code."""
-        self.debug_print("🔨 DEBUG: assemble_code() called")
         try:
             assembly_code = self.assembly_text.get(1.0, tk.END)
-            self.debug_print(f"🔨 DEBUG: Assembly code length: {len(assembly_code.strip())} chars")
-            
-            # Clear previous output
-            self.clear_output()
+            if self._debug_on:
+                # Stripping copies the whole source, so only do it when tracing
+                self.debug_print("[ASM] DEBUG: assemble_code() called, code length: %d chars", len(assembly_code.strip()))
             
             # Perform assembly
-            result = self.assembler.assemble(assembly_code)
-            self.debug_print(f"🔨 DEBUG: Assembly completed, success: {result['success']}")
+            self.status_var.set("Assembling...")
+            self.run_assembly(assembly_code, self._show_assembly_result)
+        except Exception as e:
+            self.debug_print(f"[ERROR] DEBUG: Exception in assemble_code(): {e}")
+            messagebox.showerror("Assembly Error", f"An error occurred during assembly: {str(e)}")
+            self.status_var.set("Assembly error occurred")
+    
+    def _show_assembly_result(self, result):
+        """Display the output of an assembly started by assemble_code."""
+        try:
+            # Clear previous mappings here rather than when assembly is
+            # requested: repeated requests for the same source share one
+            # result, and each of them ends up here. The text outputs are
+            # replaced wholesale below.
+            self.mapping_tree.delete(*self.mapping_tree.get_children())
             
+            if isinstance(result, Exception):
+                raise result
             if result['success']:
-                self.debug_print(f"🔨 DEBUG: Assembly successful, {len(result.get('mappings', []))} mappings generated")
-                
                 # Display object code
-                self.object_text.config(state='normal')
-                self.object_text.insert(tk.END, result['object_code'])
-                self.object_text.config(state='disabled')
+                self._set_output_text(self.object_text, result['object_code'])
                 
-                # Display line-by-line mapping
-                for mapping in result['mappings']:
-                    self.mapping_tree.insert('', tk.END, values=(
-                        mapping['line'],
-                        mapping['address'],
-                        mapping['object_code'],
-                        mapping['assembly']
-                    ))
+                # Display line-by-line mapping; rows go straight to Tcl to skip
+                # Treeview.insert's per-row option handling, and the scrollbar
+                # is unhooked so it is only updated once after the fill
+                tree_call = self.mapping_tree.tk.call
+                tree_path = self.mapping_tree._w
+                yscrollcommand = self.mapping_tree.cget('yscrollcommand')
+                self.mapping_tree.configure(yscrollcommand='')
+                for row in result['mapping_rows']:
+                    tree_call(tree_path, 'insert', '', 'end', '-values', row)
+                self.mapping_tree.configure(yscrollcommand=yscrollcommand)
                 
                 # Display messages
-                if result['messages']:
-                    self.error_text.config(state='normal')
-                    for msg in result['messages']:
-                        self.error_text.insert(tk.END, f"{msg}\n")
-                    self.error_text.config(state='disabled')
+                self._set_output_text(self.error_text, ''.join(f"{msg}\n" for msg in result['messages']))
                 
                 self.status_var.set(f"Assembly successful - {len(result['mappings'])} instructions processed")
-                self.debug_print("🔨 DEBUG: Assembly output displayed successfully")
+                self.debug_print("[ASM] DEBUG: Assembly successful, %d mappings displayed", len(result['mappings']))
                 
             else:
-                self.debug_print(f"🔨 DEBUG: Assembly failed with {len(result.get('errors', []))} errors")
+                self.debug_print("[ASM] DEBUG: Assembly failed with %d errors: %r",
+                                 len(result['errors']), result['errors'])
                 
                 # Display errors
-                self.error_text.config(state='normal')
-                for error in result['errors']:
-                    self.error_text.insert(tk.END, f"ERROR: {error}\n")
-                    self.debug_print(f"🔨 DEBUG: Assembly error: {error}")
-                self.error_text.config(state='disabled')
+                self._set_output_text(self.object_text, '')
+                self._set_output_text(self.error_text, ''.join(f"ERROR: {error}\n" for error in result['errors']))
                 
                 self.status_var.set("Assembly failed - check errors tab")
                 
         except Exception as e:
-            self.debug_print(f"❌ DEBUG: Exception in assemble_code(): {e}")
+            self.debug_print(f"[ERROR] DEBUG: Exception in assemble_code(): {e}")
             messagebox.showerror("Assembly Error", f"An error occurred during assembly: {str(e)}")
             self.status_var.set("Assembly error occurred")
     
     # Simulator methods
     def load_program(self):
         """Load the assembled program into the simulator."""
-        self.debug_print("🔧 DEBUG: load_program() called")
         try:
             assembly_code = self.assembly_text.get(1.0, tk.END)
-            self.debug_print(f"🔧 DEBUG: Got assembly code, length: {len(assembly_code.strip())} chars")
-            result = self.assembler.assemble(assembly_code)
-            self.debug_print(f"🔧 DEBUG: Assembly result success: {result['success']}")
-            
+            if self._debug_on:
+                # Stripping copies the whole source, so only do it when tracing
+                self.debug_print("[LOAD] DEBUG: load_program() called, code length: %d chars", len(assembly_code.strip()))
+            self.run_assembly(assembly_code, self._load_assembly_result)
+        except Exception as e:
+            self.debug_print(f"[ERROR] DEBUG: Exception in load_program(): {e}")
+            messagebox.showerror("Load Error", f"Could not load program: {str(e)}")
+    
+    def _load_assembly_result(self, result):
+        """Load the output of an assembly started by load_program."""
+        try:
+            if isinstance(result, Exception):
+                raise result
             if result['success']:
-                self.debug_print(f"🔧 DEBUG: Loading {len(result['object_data'])} bytes into simulator")
                 self.simulator.load_program(result['object_data'])
                 self.update_simulator_display()
                 self.status_var.set("Program loaded into simulator")
-                self.debug_print("🔧 DEBUG: Program loaded successfully")
+                self.debug_print("[LOAD] DEBUG: Loaded %d bytes into simulator", len(result['object_data']))
             else:
-                self.debug_print(f"🔧 DEBUG: Assembly failed with errors: {result.get('errors', [])}")
+                self.debug_print("[LOAD] DEBUG: Assembly failed with errors: %s", result.get('errors', []))
                 messagebox.showerror("Load Error", "Please assemble the code successfully first")
         except Exception as e:
-            self.debug_print(f"❌ DEBUG: Exception in load_program(): {e}")
+            self.debug_print(f"[ERROR] DEBUG: Exception in load_program(): {e}")
             messagebox.showerror("Load Error", f"Could not load program: {str(e)}")
     
     def reset_simulator(self):
         """Reset the simulator state."""
-        self.debug_print("🔄 DEBUG: reset_simulator() called")
         try:
-            self.debug_print("🔄 DEBUG: Calling simulator.reset()")
             self.simulator.reset()
-            self.debug_print("🔄 DEBUG: Reset completed, attempting auto-reload")
+            self.debug_print("[RESET] DEBUG: reset_simulator() reset the simulator, attempting auto-reload")
             
             # Auto-reload the program after reset if assembly was successful
             assembly_code = self.assembly_text.get(1.0, tk.END)
-            result = self.assembler.assemble(assembly_code)
-            self.debug_print(f"🔄 DEBUG: Assembly for reload - success: {result['success']}")
-            
+            self.run_assembly(assembly_code, self._reload_assembly_result)
+        except Exception as e:
+            self.debug_print(f"[ERROR] DEBUG: Exception in reset_simulator(): {e}")
+            messagebox.showerror("Reset Error", f"Could not reset simulator: {str(e)}")
+    
+    def _reload_assembly_result(self, result):
+        """Reload the output of an assembly started by reset_simulator."""
+        try:
+            if isinstance(result, Exception):
+                raise result
             if result['success']:
-                self.debug_print("🔄 DEBUG: Reloading program after reset")
                 self.simulator.load_program(result['object_data'])
             
             self.update_simulator_display()
             self.status_var.set("Simulator reset and program reloaded")
-            self.debug_print("🔄 DEBUG: Reset and reload completed successfully")
+            self.debug_print("[RESET] DEBUG: Reset completed, program reloaded: %s", result['success'])
         except Exception as e:
-            self.debug_print(f"❌ DEBUG: Exception in reset_simulator(): {e}")
+            self.debug_print(f"[ERROR] DEBUG: Exception in reset_simulator(): {e}")
             messagebox.showerror("Reset Error", f"Could not reset simulator: {str(e)}")
     
     def step_execution(self):
         """Execute one instruction in the simulator."""
-        self.debug_print("👟 DEBUG: step_execution() called")
         try:
+            # Bind the simulator once; the attribute is a lazily-creating property
+            simulator = self.simulator
+            registers = simulator.registers
+            
             # Check if a program is loaded
-            if not hasattr(self.simulator, 'program_data') or not self.simulator.program_data:
-                self.debug_print("⚠️ DEBUG: No program loaded, showing warning")
+            if not simulator.program_data:
+                self.debug_print("[WARN] DEBUG: step_execution() with no program loaded, showing warning")
                 messagebox.showwarning("No Program", "Please load a program first using 'Load Program' button")
                 return
-                
-            self.debug_print(f"👟 DEBUG: Program loaded, checking halt state: {self.simulator.execution_halted}")
             
             # Check if execution is already halted
-            if self.simulator.execution_halted:
-                self.debug_print("⚠️ DEBUG: Execution already halted, showing info")
+            if simulator.execution_halted:
+                self.debug_print("[WARN] DEBUG: step_execution() after execution halted, showing info")
                 messagebox.showinfo("Execution Complete", "Program execution has completed. Use Reset to restart.")
                 return
             
-            pc_before = self.simulator.get_register_value('PC')
-            self.debug_print(f"👟 DEBUG: Executing step, PC before: ${pc_before:04X}")
+            pc_before = registers['PC']
+            success = simulator.step()
+            pc_after = registers['PC']
             
-            success = self.simulator.step()
-            pc_after = self.simulator.get_register_value('PC')
+            # One trace record per step, formatted only when tracing is on
+            self.debug_print("[STEP] DEBUG: step_execution() PC $%04X -> $%04X, result: %s, halted: %s",
+                             pc_before, pc_after, success, simulator.execution_halted)
             
-            self.debug_print(f"👟 DEBUG: Step result: {success}, PC after: ${pc_after:04X}")
-            
-            self.update_simulator_display()
+            self._schedule_simulator_display()
             
             if success:
-                self.status_var.set(f"Executed one instruction - PC=${self.simulator.get_register_value('PC'):04X}")
-                self.debug_print("👟 DEBUG: Step executed successfully")
+                self.status_var.set(f"Executed one instruction - PC=${pc_after:04X}")
             else:
                 self.status_var.set("Execution halted")
-                self.debug_print("👟 DEBUG: Step failed - execution halted")
-                if self.simulator.execution_halted:
+                if simulator.execution_halted:
                     messagebox.showinfo("Execution Complete", "Program execution has completed.")
         except Exception as e:
-            self.debug_print(f"❌ DEBUG: Exception in step_execution(): {e}")
+            self.debug_print(f"[ERROR] DEBUG: Exception in step_execution(): {e}")
             messagebox.showerror("Execution Error", f"Could not execute instruction: {str(e)}")
     
     def run_simulation(self):
         """Run the simulation until completion or breakpoint."""
-        self.debug_print("🏃 DEBUG: run_simulation() called")
         try:
+            # Bind the simulator once; the attribute is a lazily-creating property
+            simulator = self.simulator
+            registers = simulator.registers
+            
             # Check if a program is loaded
-            if not hasattr(self.simulator, 'program_data') or not self.simulator.program_data:
-                self.debug_print("⚠️ DEBUG: No program loaded for run, showing warning")
+            if not simulator.program_data:
+                self.debug_print("[WARN] DEBUG: run_simulation() with no program loaded, showing warning")
                 messagebox.showwarning("No Program", "Please load a program first using 'Load Program' button")
                 return
-                
-            self.debug_print(f"🏃 DEBUG: Program loaded, checking halt state: {self.simulator.execution_halted}")
             
             # Check if execution is already halted
-            if self.simulator.execution_halted:
-                self.debug_print("⚠️ DEBUG: Already halted for run, showing info")
+            if simulator.execution_halted:
+                self.debug_print("[WARN] DEBUG: run_simulation() after execution halted, showing info")
                 messagebox.showinfo("Execution Complete", "Program execution has completed. Use Reset to restart.")
                 return
             
-            pc_before = self.simulator.get_register_value('PC')
-            self.debug_print(f"🏃 DEBUG: Starting run, PC before: ${pc_before:04X}")
-            
-            steps = self.simulator.run()
-            pc_after = self.simulator.get_register_value('PC')
+            pc_before = registers['PC']
+            steps = simulator.run()
+            pc_after = registers['PC']
             
-            self.debug_print(f"🏃 DEBUG: Run completed, {steps} steps executed, PC after: ${pc_after:04X}")
+            self.debug_print("[RUN] DEBUG: run_simulation() PC $%04X -> $%04X, %d steps executed",
+                             pc_before, pc_after, steps)
             
             self.update_simulator_display()
             
             if steps > 0:
                 self.status_var.set(f"Simulation completed - {steps} instructions executed")
-                self.debug_print(f"🏃 DEBUG: Run successful, showing completion dialog")
                 messagebox.showinfo("Simulation Complete", f"Executed {steps} instructions.\nProgram execution completed.")
             else:
-                self.debug_print("🏃 DEBUG: No instructions executed during run")
                 self.status_var.set("No instructions executed")
         except Exception as e:
-            self.debug_print(f"❌ DEBUG: Exception in run_simulation(): {e}")
+            self.debug_print(f"[ERROR] DEBUG: Exception in run_simulation(): {e}")
             messagebox.showerror("Simulation Error", f"Simulation error: {str(e)}")
     
+    def _schedule_simulator_display(self):
+        """Refresh the simulator display once the event queue is idle.
+        
+        Requests made before the refresh runs (e.g. rapid Step clicks) are
+        folded into that one refresh.
+        """
+        if not self._display_pending:
+            self._display_pending = True
+            self.root.after_idle(self._refresh_simulator_display)
+    
+    def _refresh_simulator_display(self):
+        """Run a refresh queued by _schedule_simulator_display."""
+        self._display_pending = False
+        self.update_simulator_display()
+    
     def update_simulator_display(self):
         """Update the simulator display with current state."""
-        self.debug_print("📺 DEBUG: update_simulator_display() called")
         try:
             # Update registers using the existing register display method
             self.update_register_display()
             
-            # Update memory view
-            self.memory_text.config(state='normal')
-            self.memory_text.delete(1.0, tk.END)
-            
-            memory_dump = self.simulator.get_memory_dump()
-            self.memory_text.insert(tk.END, memory_dump)
-            self.memory_text.config(state='disabled')
-            self.debug_print("📺 DEBUG: Simulator display updated successfully")
+            # Update memory view, rewriting only the dump lines that changed
+            # since the last update; a step usually touches one line or none
+            lines = self.simulator.get_memory_dump().split('\n')
+            prev_lines = self._prev_memory_lines
+            if len(lines) != len(prev_lines):
+                self._set_output_text(self.memory_text, '\n'.join(lines))
+            else:
+                changed = [(line_num, line) for line_num, (old, line)
+                           in enumerate(zip(prev_lines, lines), 1) if old != line]
+                if changed:
+                    self.memory_text.config(state='normal')
+                    for line_num, line in changed:
+                        self.memory_text.replace(f"{line_num}.0", f"{line_num}.end", line)
+                    self.memory_text.config(state='disabled')
+            self._prev_memory_lines = lines
+            self.debug_print("[DISPLAY] DEBUG: update_simulator_display() completed")
         except Exception as e:
-            self.debug_print(f"❌ DEBUG: Exception in update_simulator_display(): {e}")
+            self.debug_print(f"[ERROR] DEBUG: Exception in update_simulator_display(): {e}")
     
     # Help and utility methods
     def show_instruction_set(self):
         """Show the instruction set reference."""
+        # The reference never changes, so an open window is simply raised
+        existing = self._instruction_window
+        if existing is not None and existing.winfo_exists():
+            existing.deiconify()
+            existing.lift()
+            return
+        
         instruction_window = tk.Toplevel(self.root)
+        self._instruction_window = instruction_window
         instruction_window.title("Motorola 6800 Instruction Set Reference")
         instruction_window.geometry("800x600")
         
         text_widget = scrolledtext.ScrolledText(instruction_window, wrap=tk.WORD, font=('Consolas', 10))
         text_widget.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Load instruction set reference
-        reference_text = self.assembler.get_instruction_reference()
-        text_widget.insert(tk.END, reference_text)
+        # Load instruction set reference (built once per session)
+        if self._instr_ref_text is None:
+            self._instr_ref_text = self.assembler.get_instruction_reference()
+        text_widget.insert(tk.END, self._instr_ref_text)
         text_widget.config(state='disabled')
     
+    @staticmethod
+    def _parse_hex(text):
+        """Parse a hexadecimal value written as FF, $FF or 0xFF.
+        
+        Raises ValueError if text isn't valid hex.
+        """
+        text = text.strip()
+        if text.startswith('$'):
+            text = text[1:]
+        return int(text, 16)  # also accepts a 0x prefix
+    
     def show_memory_viewer(self):
         """Show a detailed memory viewer window."""
+        # Only one viewer exists at a time; bring it back instead of building
+        # a second window whose widgets would replace the first one's
+        existing = self._memory_window
+        if existing is not None and existing.winfo_exists():
+            existing.deiconify()
+            existing.lift()
+            existing.focus_set()
+            return
+        
         memory_window = tk.Toplevel(self.root)
+        self._memory_window = memory_window
         memory_window.title("Memory Viewer")
         memory_window.geometry("800x600")
         memory_window.minsize(600, 400)
@@ -689,16 +1216,10 @@ class AssemblerGUI:
         
         def go_to_address():
             try:
-                addr_str = self.addr_var.get().strip()
-                if addr_str.startswith('$'):
-                    addr = int(addr_str[1:], 16)
-                elif addr_str.startswith('0x'):
-                    addr = int(addr_str, 16)
-                else:
-                    addr = int(addr_str, 16)
+                addr = self._parse_hex(self.addr_var.get())
                 addr = max(0, min(addr, 0xFFE0))  # Keep within valid range
                 self.current_mem_addr = addr
-                refresh_memory()
+                schedule_refresh()
             except ValueError:
                 messagebox.showerror("Invalid Address", "Please enter a valid hexadecimal address (e.g., 1000, $1000, or 0x1000)")
         
@@ -717,23 +1238,17 @@ class AssemblerGUI:
                     return
                 
                 # Parse search value (hex byte)
-                if search_str.startswith('$'):
-                    search_val = int(search_str[1:], 16)
-                elif search_str.startswith('0x'):
-                    search_val = int(search_str, 16)
-                else:
-                    search_val = int(search_str, 16)
-                
-                search_val = search_val & 0xFF  # Ensure it's a byte
+                search_val = self._parse_hex(search_str) & 0xFF  # Ensure it's a byte
                 
-                # Search from current address
+                # Search from current address to the end of memory in one find()
                 start_addr = getattr(self, 'current_mem_addr', 0x1000)
-                for addr in range(start_addr, 0x10000):
-                    if self.simulator.get_memory_value(addr) == search_val:
-                        self.current_mem_addr = addr & 0xFFF0  # Align to 16-byte boundary
-                        self.addr_var.set(f"{self.current_mem_addr:04X}")
-                        refresh_memory()
-                        return
+                index = self.simulator.get_memory_slice(start_addr, 0x10000).find(search_val)
+                if index >= 0:
+                    addr = start_addr + index
+                    self.current_mem_addr = addr & 0xFFF0  # Align to 16-byte boundary
+                    self.addr_var.set(f"{self.current_mem_addr:04X}")
+                    refresh_memory()
+                    return
                 
                 messagebox.showinfo("Search", f"Value ${search_val:02X} not found from address ${start_addr:04X}")
             except ValueError:
@@ -752,12 +1267,16 @@ class AssemblerGUI:
         text_frame = ttk.Frame(mem_frame)
         text_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.mem_text = tk.Text(text_frame, font=('Consolas', 10), wrap=tk.NONE, 
+        # No wrapping (rows are fixed width) and no undo history, so redrawing
+        # the page doesn't make Tk re-wrap lines or record undo separators
+        self.mem_text = tk.Text(text_frame, font=('Consolas', 10), wrap=tk.NONE, undo=False,
                                bg='#f8f8f8', fg='#000000', selectbackground='#0078d4')
-        scrollbar_v = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=self.mem_text.yview)
+        # The vertical scrollbar moves through the address space, not the text
+        scrollbar_v = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=lambda *args: scroll_memory(*args))
         scrollbar_h = ttk.Scrollbar(text_frame, orient=tk.HORIZONTAL, command=self.mem_text.xview)
         
-        self.mem_text.config(yscrollcommand=scrollbar_v.set, xscrollcommand=scrollbar_h.set)
+        self.mem_text.config(xscrollcommand=scrollbar_h.set)
+        self.mem_text.tag_configure('changed', foreground='#FF0000')
         
         # Grid layout for text and scrollbars
         self.mem_text.grid(row=0, column=0, sticky='nsew')
@@ -778,94 +1297,72 @@ class AssemblerGUI:
         def on_double_click(event):
             try:
                 # Get cursor position
-                cursor_pos = self.mem_text.index(tk.INSERT)
-                line_num = int(cursor_pos.split('.')[0]) - 1
-                col_num = int(cursor_pos.split('.')[1])
+                line_str, col_str = self.mem_text.index(tk.INSERT).split('.')
+                col_num = int(col_str)
                 
                 # Calculate memory address based on cursor position
                 # Format: "ADDR:   +0 +1 +2 ... +F  ASCII"
-                # Each line shows 16 bytes starting at line_addr
-                
-                if line_num < 0:
+                # Data rows start on text line 3, below the two header lines;
+                # each shows 16 bytes. Clicks on the header or footer are ignored
+                row = int(line_str) - 3
+                if not 0 <= row < visible_rows():
                     return
                     
-                base_addr = getattr(self, 'current_mem_addr', 0x1000) + (line_num * 16)
+                base_addr = getattr(self, 'current_mem_addr', 0x1000) + (row * 16)
                 
-                # Check if click is in hex area (columns 8-55)
-                if 8 <= col_num <= 55:
-                    # Calculate which byte was clicked
-                    hex_col = col_num - 8
-                    byte_index = hex_col // 3  # Each hex byte takes 3 chars (XX )
-                    
-                    if byte_index < 16:
-                        addr = base_addr + byte_index
-                        if 0 <= addr <= 0xFFFF:
-                            edit_memory_value(addr)
+                # Look up which byte was clicked (-1 outside the hex area)
+                byte_index = self._MEM_COL_TO_BYTE[col_num] if col_num < len(self._MEM_COL_TO_BYTE) else -1
+                if byte_index >= 0:
+                    addr = base_addr + byte_index
+                    if 0 <= addr <= 0xFFFF:
+                        edit_memory_value(addr, f"{line_str}.{8 + byte_index * 3}")
                             
             except Exception as e:
                 self.debug_print(f"Error in memory viewer double-click: {e}")
         
-        def edit_memory_value(address):
-            """Edit a memory value at the given address."""
+        # Inline editor shown over the clicked hex cell; one entry is created
+        # per viewer and reused for every edit
+        self._inline_edit = ttk.Entry(self.mem_text, width=3)
+        self._inline_edit_addr = None
+        
+        def edit_memory_value(address, index):
+            """Edit the memory value at address, shown at text index."""
+            bbox = self.mem_text.bbox(index)
+            if bbox is None:
+                return  # cell scrolled out of view
             current_val = self.simulator.get_memory_value(address)
+            self._inline_edit_addr = address
             
-            # Create edit dialog
-            edit_dialog = tk.Toplevel(memory_window)
-            edit_dialog.title(f"Edit Memory at ${address:04X}")
-            edit_dialog.geometry("300x150")
-            edit_dialog.resizable(False, False)
-            edit_dialog.transient(memory_window)
-            edit_dialog.grab_set()
-            
-            # Center the dialog
-            edit_dialog.update_idletasks()
-            x = memory_window.winfo_x() + (memory_window.winfo_width() // 2) - (edit_dialog.winfo_width() // 2)
-            y = memory_window.winfo_y() + (memory_window.winfo_height() // 2) - (edit_dialog.winfo_height() // 2)
-            edit_dialog.geometry(f"+{x}+{y}")
-            
-            # Dialog content
-            ttk.Label(edit_dialog, text=f"Address: ${address:04X}").pack(pady=10)
-            ttk.Label(edit_dialog, text=f"Current Value: ${current_val:02X} ({current_val})").pack()
-            
-            ttk.Label(edit_dialog, text="New Value:").pack(pady=(10, 5))
-            new_val_var = tk.StringVar(value=f"{current_val:02X}")
-            val_entry = ttk.Entry(edit_dialog, textvariable=new_val_var, width=10)
-            val_entry.pack()
-            val_entry.select_range(0, tk.END)
-            val_entry.focus()
-            
-            def save_value():
-                try:
-                    val_str = new_val_var.get().strip()
-                    if val_str.startswith('$'):
-                        new_val = int(val_str[1:], 16)
-                    elif val_str.startswith('0x'):
-                        new_val = int(val_str, 16)
-                    else:
-                        new_val = int(val_str, 16)
-                    
-                    if 0 <= new_val <= 255:
-                        self.simulator.set_memory_value(address, new_val)
-                        refresh_memory()
-                        edit_dialog.destroy()
-                        self.mem_status_var.set(f"Updated ${address:04X} = ${new_val:02X}")
-                    else:
-                        messagebox.showerror("Invalid Value", "Value must be between 0 and 255 (00-FF)")
-                except ValueError:
-                    messagebox.showerror("Invalid Value", "Please enter a valid hexadecimal value")
-            
-            def cancel_edit():
-                edit_dialog.destroy()
-            
-            # Buttons
-            btn_frame = ttk.Frame(edit_dialog)
-            btn_frame.pack(pady=10)
-            ttk.Button(btn_frame, text="Save", command=save_value).pack(side=tk.LEFT, padx=5)
-            ttk.Button(btn_frame, text="Cancel", command=cancel_edit).pack(side=tk.LEFT, padx=5)
-            
-            # Bind Enter key to save
-            val_entry.bind('<Return>', lambda e: save_value())
-            edit_dialog.bind('<Escape>', lambda e: cancel_edit())
+            entry = self._inline_edit
+            entry.delete(0, tk.END)
+            entry.insert(0, f"{current_val:02X}")
+            entry.place(x=bbox[0], y=bbox[1], width=bbox[2] * 3, height=bbox[3])
+            entry.select_range(0, tk.END)
+            entry.focus_set()
+            self.mem_status_var.set(f"Editing ${address:04X} (current ${current_val:02X}) - Enter to save, Escape to cancel")
+        
+        def save_value(event=None):
+            address = self._inline_edit_addr
+            try:
+                new_val = self._parse_hex(self._inline_edit.get())
+                
+                if 0 <= new_val <= 255:
+                    self.simulator.set_memory_value(address, new_val)
+                    refresh_memory()  # also hides the entry
+                    self.mem_text.focus_set()
+                    self.mem_status_var.set(f"Updated ${address:04X} = ${new_val:02X}")
+                else:
+                    messagebox.showerror("Invalid Value", "Value must be between 0 and 255 (00-FF)")
+            except ValueError:
+                messagebox.showerror("Invalid Value", "Please enter a valid hexadecimal value")
+        
+        def cancel_edit(event=None):
+            self._inline_edit.place_forget()
+            self._inline_edit_addr = None
+            self.mem_text.focus_set()
+        
+        self._inline_edit.bind('<Return>', save_value)
+        self._inline_edit.bind('<Escape>', cancel_edit)
         
         # Bind double-click for editing
         self.mem_text.bind('<Double-Button-1>', on_double_click)
@@ -875,14 +1372,15 @@ class AssemblerGUI:
         
         # Navigation functions
         def prev_page():
-            self.current_mem_addr = max(0, self.current_mem_addr - 256)
+            self.current_mem_addr = max(0, self.current_mem_addr - visible_rows() * 16)
             self.addr_var.set(f"{self.current_mem_addr:04X}")
-            refresh_memory()
+            schedule_refresh()
         
         def next_page():
-            self.current_mem_addr = min(0xFF00, self.current_mem_addr + 256)
+            page_size = visible_rows() * 16
+            self.current_mem_addr = min(0x10000 - page_size, self.current_mem_addr + page_size)
             self.addr_var.set(f"{self.current_mem_addr:04X}")
-            refresh_memory()
+            schedule_refresh()
         
         # Navigation buttons
         nav_frame = ttk.Frame(status_frame)
@@ -890,57 +1388,103 @@ class AssemblerGUI:
         ttk.Button(nav_frame, text="<< Prev Page", command=prev_page).pack(side=tk.LEFT, padx=2)
         ttk.Button(nav_frame, text="Next Page >>", command=next_page).pack(side=tk.LEFT, padx=2)
         
+        # Only the rows that fit in the window are formatted; the page grows
+        # and shrinks with the window
+        line_height = tkfont.Font(font=self.mem_text['font']).metrics('linespace')
+        
+        def visible_rows():
+            """Number of 16-byte rows that fit between the header and footer."""
+            height = self.mem_text.winfo_height()
+            if height <= 1:
+                return 16  # not laid out yet
+            return max(1, height // line_height - 6)
+        
+        def scroll_memory(*args):
+            """Handle the vertical scrollbar over the full $0000-$FFFF range."""
+            page_size = visible_rows() * 16
+            if args[0] == 'moveto':
+                # Dragging past either end of the trough yields fractions
+                # outside [0, 1]; clamp them so the address can't wrap
+                fraction = max(0.0, min(float(args[1]), 1.0))
+                addr = int(fraction * 0x10000) & ~0xF
+            else:
+                step = 16 if args[2] == 'units' else page_size
+                addr = self.current_mem_addr + int(args[1]) * step
+            self.current_mem_addr = max(0, min(addr, 0x10000 - page_size))
+            self.addr_var.set(f"{self.current_mem_addr:04X}")
+            schedule_refresh()
+        
+        def on_mouse_wheel(event):
+            scroll_memory('scroll', -3 if event.delta > 0 else 3, 'units')
+            return 'break'
+        
+        self.mem_text.bind('<MouseWheel>', on_mouse_wheel)
+        self.mem_text.bind('<Configure>', lambda e: schedule_refresh())
+        
+        # Rendered pages by start address, stored with the bytes they show
+        page_cache = {}
+        
         def refresh_memory():
             """Refresh the memory display."""
             try:
                 start_addr = getattr(self, 'current_mem_addr', 0x1000)
                 
-                # Generate memory dump for current view (16 lines = 256 bytes)
-                self.mem_text.config(state='normal')
-                self.mem_text.delete(1.0, tk.END)
-                
-                # Header
-                header = "Address  +0 +1 +2 +3 +4 +5 +6 +7 +8 +9 +A +B +C +D +E +F  ASCII\n"
-                header += "-" * 72 + "\n"
-                self.mem_text.insert(tk.END, header)
+                # Any open inline edit refers to the old layout
+                self._inline_edit.place_forget()
                 
-                # Memory lines
-                for line in range(16):  # Show 16 lines
-                    addr = start_addr + (line * 16)
-                    if addr > 0xFFFF:
-                        break
-                    
-                    # Address column
-                    line_text = f"{addr:04X}:   "
+                # Generate memory dump for current view (one line per 16 bytes)
+                # Reuse the rendered page if its bytes haven't changed since
+                # it was last shown
+                data = self.simulator.get_memory_slice(start_addr, visible_rows() * 16)
+                cached = page_cache.get(start_addr)
+                changed = []
+                if cached is not None and cached[0] == data:
+                    page = cached[1]
+                else:
+                    # Hex cells of bytes that differ from the last time this
+                    # page was shown, as flat (start, end) index pairs
+                    if cached is not None and len(cached[0]) == len(data):
+                        old_data = cached[0]
+                        for row_start in range(0, len(data), 16):
+                            # Whole rows are compared in C first; only rows
+                            # that differ are walked byte by byte
+                            row_end = row_start + 16
+                            if old_data[row_start:row_end] == data[row_start:row_end]:
+                                continue
+                            line = 3 + row_start // 16
+                            for offset in range(row_start, min(row_end, len(data))):
+                                if old_data[offset] != data[offset]:
+                                    column = 8 + (offset - row_start) * 3
+                                    changed.append(f"{line}.{column}")
+                                    changed.append(f"{line}.{column + 2}")
                     
-                    # Hex values
-                    hex_bytes = []
-                    ascii_chars = []
+                    # The page is written into one bytearray and decoded once
+                    # Header
+                    buf = bytearray(self._MEM_HEADER)
                     
-                    for byte_offset in range(16):
-                        byte_addr = addr + byte_offset
-                        if byte_addr <= 0xFFFF:
-                            byte_val = self.simulator.get_memory_value(byte_addr)
-                            hex_bytes.append(f"{byte_val:02X}")
-                            
-                            # ASCII representation
-                            if 32 <= byte_val <= 126:
-                                ascii_chars.append(chr(byte_val))
-                            else:
-                                ascii_chars.append(".")
-                        else:
-                            hex_bytes.append("  ")
-                            ascii_chars.append(" ")
+                    # Memory lines (16 bytes each). The hex and ASCII columns
+                    # are converted for the whole page at once and sliced per
+                    # row; a short last row (past $FFFF) is padded with blanks.
+                    hex_bytes = data.hex(' ').upper().encode('ascii')
+                    ascii_bytes = data.translate(self._MEM_ASCII)
+                    for offset in range(0, len(data), 16):
+                        buf += self._MEM_ROW_FMT % (start_addr + offset,
+                                                    hex_bytes[offset * 3:offset * 3 + 47],
+                                                    ascii_bytes[offset:offset + 16])
                     
-                    # Build complete line
-                    line_text += " ".join(hex_bytes) + "  " + "".join(ascii_chars) + "\n"
-                    self.mem_text.insert(tk.END, line_text)
+                    # Footer with instructions
+                    buf += self._MEM_FOOTER % (start_addr, start_addr + len(data) - 1)
+                    page = buf.decode('utf-8')
+                    page_cache[start_addr] = (data, page)
                 
-                # Footer with instructions
-                footer = "\n" + "=" * 72 + "\n"
-                footer += "Instructions: Double-click on hex values to edit • Use Go/Search to navigate\n"
-                footer += f"Showing: ${start_addr:04X} - ${min(start_addr + 255, 0xFFFF):04X}"
-                self.mem_text.insert(tk.END, footer)
+                # The old page is swapped for the new one in a single replace,
+                # then changed bytes are colored with one tag_add over all
+                # their ranges
+                self.mem_text.config(state='normal')
+                self.mem_text.replace(1.0, tk.END, page)
+                if changed:
+                    self.mem_text.tag_add('changed', *changed)
+                scrollbar_v.set(start_addr / 0x10000, (start_addr + len(data)) / 0x10000)
                 
                 self.mem_text.config(state='disabled')
                 self.mem_status_var.set(f"Displaying memory from ${start_addr:04X}")
@@ -952,13 +1496,26 @@ class AssemblerGUI:
                 self.mem_text.insert(tk.END, f"Error displaying memory: {str(e)}")
                 self.mem_text.config(state='disabled')
         
+        # Navigation can fire many times in a burst (held Page Up/Down); only
+        # the last request in each burst actually redraws
+        self._refresh_after_id = None
+        
+        def schedule_refresh():
+            if self._refresh_after_id:
+                memory_window.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = memory_window.after(60, do_refresh)
+        
+        def do_refresh():
+            self._refresh_after_id = None
+            refresh_memory()
+        
         # Initial memory display
         refresh_memory()
         
         # Keyboard shortcuts
         def handle_key(event):
             if event.keysym == 'F5':
-                refresh_memory()
+                schedule_refresh()
             elif event.keysym == 'Prior':  # Page Up
                 prev_page()
             elif event.keysym == 'Next':   # Page Down
@@ -1017,13 +1574,15 @@ Author: Software Engineering (English) - GROUP 2
     def open_logs_folder(self):
         """Open the logs folder in file explorer."""
         try:
-            if os.path.exists('logs'):
+            if os.path.isdir('logs'):
                 if sys.platform == 'win32':
                     os.startfile('logs')
-                elif sys.platform == 'darwin':  # macOS
-                    os.system('open logs')
-                else:  # Linux
-                    os.system('xdg-open logs')
+                else:
+                    # Launch the opener directly, without a shell, and don't
+                    # wait for it
+                    opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                    subprocess.Popen([opener, os.path.abspath('logs')],
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             else:
                 messagebox.showinfo("Logs Folder", "Logs folder doesn't exist yet. Run some operations to generate logs.")
         except Exception as e:
@@ -1031,36 +1590,31 @@ Author: Software Engineering (English) - GROUP 2
 
     def update_register_display(self):
         """Update the register display with current simulator values."""
-        self.debug_print("🖥️ DEBUG: update_register_display() called")
-        
         try:
             registers = self.simulator.registers
             
-            # Update register labels
-            self.reg_a_label.config(text=f"{registers['A']:02X}")
-            self.reg_b_label.config(text=f"{registers['B']:02X}")
-            self.reg_x_label.config(text=f"{registers['X']:04X}")
-            self.reg_y_label.config(text=f"{registers['Y']:04X}")
-            self.reg_sp_label.config(text=f"{registers['SP']:04X}")
-            self.reg_pc_label.config(text=f"{registers['PC']:04X}")
-            self.reg_cc_label.config(text=f"{registers['CC']:02X}")
+            # Update register labels, skipping those whose value hasn't changed
+            last_regs = self._last_regs
+            for name, label, digits in self._reg_labels:
+                value = registers[name]
+                if value != last_regs.get(name):
+                    label.config(text=f"{value:0{digits}X}")
+                    last_regs[name] = value
             
-            self.debug_print(f"🖥️ DEBUG: Registers updated - A:{registers['A']:02X} B:{registers['B']:02X} X:{registers['X']:04X} Y:{registers['Y']:04X} SP:{registers['SP']:04X} PC:{registers['PC']:04X} CC:{registers['CC']:02X}")
+            self.debug_print("[REGS] DEBUG: Registers updated - A:%02X B:%02X X:%04X Y:%04X SP:%04X PC:%04X CC:%02X",
+                             registers['A'], registers['B'], registers['X'], registers['Y'],
+                             registers['SP'], registers['PC'], registers['CC'])
             
         except Exception as e:
-            self.debug_print(f"❌ DEBUG: Error updating register display: {e}")
+            self.debug_print(f"[ERROR] DEBUG: Error updating register display: {e}")
             # Set default values in case of error
-            self.reg_a_label.config(text="--")
-            self.reg_b_label.config(text="--")
-            self.reg_x_label.config(text="----")
-            self.reg_y_label.config(text="----")
-            self.reg_sp_label.config(text="----")
-            self.reg_pc_label.config(text="----")
-            self.reg_cc_label.config(text="--")
+            self._last_regs.clear()
+            for name, label, digits in self._reg_labels:
+                label.config(text='-' * digits)
 
     def load_example(self):
         """Load an example assembly program."""
-        self.debug_print("📝 DEBUG: load_example() called")
+        self.debug_print("[EXAMPLE] DEBUG: load_example() called")
         example_code = """; Motorola 6800 Assembly Example
 ; Simple program to demonstrate assembler features
 
@@ -1094,11 +1648,11 @@ FINISH: NOP              ; No operation
         self.update_line_numbers()
         
         # Apply syntax highlighting to the loaded example
-        if hasattr(self, 'syntax_highlighter') and self.highlight_enabled.get():
+        if hasattr(self, 'syntax_highlighter') and self._hl_on:
             self.root.after_idle(self.syntax_highlighter.highlight_all)
         
         self.status_var.set("Example code loaded")
-        self.debug_print("📝 DEBUG: Example code loaded successfully")
+        self.debug_print("[EXAMPLE] DEBUG: Example code loaded successfully")
 
     # File operations
     def new_file(self):
@@ -1108,6 +1662,7 @@ FINISH: NOP              ; No operation
                 return
         
         self.assembly_text.delete(1.0, tk.END)
+        self.update_line_numbers()
         self.current_file = None
         self.root.title("Motorola 6800 Assembler - New File")
         self.status_var.set("New file created")
@@ -1121,8 +1676,11 @@ FINISH: NOP              ; No operation
         
         if filename:
             try:
-                with open(filename, 'r') as file:
-                    content = file.read()
+                # Read the file in one go and decode it once; line endings
+                # are normalised the way text mode would
+                with open(filename, 'rb', buffering=1 << 20) as file:
+                    content = file.read().decode('utf-8', errors='replace')
+                content = content.replace('\r\n', '\n')
                 
                 self.assembly_text.delete(1.0, tk.END)
                 self.assembly_text.insert(1.0, content)
@@ -1132,18 +1690,27 @@ FINISH: NOP              ; No operation
                 self.update_line_numbers()
                 
                 # Apply syntax highlighting to the loaded file
-                if hasattr(self, 'syntax_highlighter') and self.highlight_enabled.get():
+                if hasattr(self, 'syntax_highlighter') and self._hl_on:
                     self.root.after_idle(self.syntax_highlighter.highlight_all)
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Could not open file: {str(e)}")
                 
+    def _write_editor_text(self, file):
+        """Write the editor contents to file in blocks of lines."""
+        # Copying a block at a time keeps large sources from being pulled
+        # through Tcl as one huge string, while still needing few get() calls
+        block = 1024
+        last_line = int(self.assembly_text.index('end-1c').split('.')[0])
+        for start in range(1, last_line + 1, block):
+            file.write(self.assembly_text.get(f"{start}.0", f"{start + block}.0"))
+    
     def save_file(self):
         """Save the current file."""
         if self.current_file:
             try:
-                with open(self.current_file, 'w') as file:
-                    file.write(self.assembly_text.get(1.0, tk.END))
+                with open(self.current_file, 'w', encoding='utf-8', buffering=1 << 20) as file:
+                    self._write_editor_text(file)
                 self.assembly_text.edit_modified(False)
                 self.status_var.set(f"Saved: {self.current_file}")
             except Exception as e:
@@ -1161,8 +1728,8 @@ FINISH: NOP              ; No operation
         
         if filename:
             try:
-                with open(filename, 'w') as file:
-                    file.write(self.assembly_text.get(1.0, tk.END))
+                with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as file:
+                    self._write_editor_text(file)
                 self.current_file = filename
                 self.root.title(f"Motorola 6800 Assembler - {os.path.basename(filename)}")
                 self.assembly_text.edit_modified(False)
@@ -1172,27 +1739,28 @@ FINISH: NOP              ; No operation
 
     def clear_input(self):
         """Clear the input text area."""
-        self.debug_print("🗑️ DEBUG: clear_input() called")
+        self.debug_print("[CLEAR] DEBUG: clear_input() called")
         self.assembly_text.delete(1.0, tk.END)
         self.update_line_numbers()
-        self.debug_print("🗑️ DEBUG: Input cleared")
+        self.debug_print("[CLEAR] DEBUG: Input cleared")
+        
+    @staticmethod
+    def _set_output_text(widget, text):
+        """Replace the whole contents of a read-only output widget."""
+        # One state toggle covers both the delete and the insert
+        widget.config(state='normal')
+        widget.replace(1.0, tk.END, text)
+        widget.config(state='disabled')
         
     def clear_output(self):
         """Clear all output areas."""
-        self.debug_print("🗑️ DEBUG: clear_output() called")
-        self.object_text.config(state='normal')
-        self.object_text.delete(1.0, tk.END)
-        self.object_text.config(state='disabled')
-        
-        for item in self.mapping_tree.get_children():
-            self.mapping_tree.delete(item)
-            
-        self.error_text.config(state='normal')
-        self.error_text.delete(1.0, tk.END)
-        self.error_text.config(state='disabled')
+        self.debug_print("[CLEAR] DEBUG: clear_output() called")
+        self._set_output_text(self.object_text, '')
+        self.mapping_tree.delete(*self.mapping_tree.get_children())
+        self._set_output_text(self.error_text, '')
         
         self.status_var.set("Output cleared")
-        self.debug_print("🗑️ DEBUG: Output cleared successfully")
+        self.debug_print("[CLEAR] DEBUG: Output cleared successfully")
 
     def setup_right_panel(self, parent):
         """Set up the right panel with output and analysis."""
@@ -1236,7 +1804,9 @@ FINISH: NOP              ; No operation
         sim_frame = ttk.Frame(notebook)
         notebook.add(sim_frame, text="Execution Simulator")
         
-        self.setup_simulator_panel(sim_frame)
+        # The simulator widgets are only built the first time the tab is shown
+        self._sim_frame = sim_frame
+        notebook.bind('<<NotebookTabChanged>>', self._build_sim_panel_on_select)
         
         # Errors/Messages tab
         error_frame = ttk.Frame(notebook)
@@ -1246,6 +1816,13 @@ FINISH: NOP              ; No operation
                                                    font=('Consolas', 9), state='disabled')
         self.error_text.pack(fill=tk.BOTH, expand=True)
         
+    def _build_sim_panel_on_select(self, event):
+        """Build the simulator panel when its tab is first selected."""
+        notebook = event.widget
+        if notebook.select() == str(self._sim_frame):
+            notebook.unbind('<<NotebookTabChanged>>')
+            self.setup_simulator_panel(self._sim_frame)
+        
     def setup_simulator_panel(self, parent):
         """Set up the execution simulator panel."""
         # Create frames for registers and memory
@@ -1288,6 +1865,14 @@ FINISH: NOP              ; No operation
         self.reg_cc_label = tk.Label(reg_frame, text="00", font=('Consolas', 9), bg='white', relief='sunken', width=8)
         self.reg_cc_label.grid(row=7, column=1, sticky='w', padx=(5,0))
         
+        # (register, label, hex digits) for each display, and the value each
+        # label currently shows
+        self._reg_labels = (('A', self.reg_a_label, 2), ('B', self.reg_b_label, 2),
+                            ('X', self.reg_x_label, 4), ('Y', self.reg_y_label, 4),
+                            ('SP', self.reg_sp_label, 4), ('PC', self.reg_pc_label, 4),
+                            ('CC', self.reg_cc_label, 2))
+        self._last_regs = {}
+        
         # Memory frame
         mem_frame = ttk.LabelFrame(top_frame, text="Memory View", padding=5)
         mem_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -1295,6 +1880,8 @@ FINISH: NOP              ; No operation
         self.memory_text = scrolledtext.ScrolledText(mem_frame, wrap=tk.NONE,
                                                     font=('Consolas', 9), height=8, state='disabled')
         self.memory_text.pack(fill=tk.BOTH, expand=True)
+        self._prev_memory_lines = []  # dump lines the memory view shows
+        self._display_pending = False  # a display refresh is queued
         
         # Control buttons for simulator
         control_frame = ttk.Frame(parent)